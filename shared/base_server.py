@@ -4,81 +4,444 @@ Provides common SOAP client functionality and authentication.
 """
 
 import os
+import asyncio
+import json
+import hashlib
 import logging
-from typing import Dict, Any, Optional
-from zeep import Client, Settings, helpers
-from zeep.exceptions import Fault, TransportError
-from zeep.transports import Transport
-from dotenv import load_dotenv
+import re
+import threading
+import time
+from concurrent.futures import CancelledError as FutureCancelledError, Future
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from string import Template
+from typing import Dict, Any, AsyncIterator, Awaitable, Iterable, List, NamedTuple, Optional, Set, Tuple
+import httpx
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from xml.sax.saxutils import escape
+from zeep import AsyncClient, Client, Settings, helpers
+from zeep.exceptions import Fault, LookupError as ZeepLookupError, NamespaceError, TransportError
+from zeep.cache import SqliteCache
+from zeep.transports import AsyncTransport, Transport
+from zeep.wsdl.utils import etree_to_string
+from zeep.xsd.valueobjects import CompoundValue
+from cachetools import TLRUCache, TTLCache
+from dotenv import dotenv_values
+
+_DOTENV_LOADED = False
+
+def load_env_once():
+    """Load .env into the environment once per process; real environment variables win"""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    os.environ.update({
+        key: value for key, value in dotenv_values().items()
+        if value is not None and key not in os.environ
+    })
+    _DOTENV_LOADED = True
 
 # Load environment variables
-load_dotenv()
+load_env_once()
 
 # Constants
 WSDL_URL = "https://api.synergywholesale.com/server.php?wsdl"
 DEFAULT_TIMEOUT = 30
+WSDL_CACHE_PATH = os.path.expanduser(os.getenv("WSDL_CACHE_PATH", "~/.cache/synergy-wsdl.db"))
+WSDL_CACHE_TIMEOUT = 86400  # Re-fetch the WSDL once a day
+API_TIMEOUT = int(os.getenv("API_TIMEOUT", str(DEFAULT_TIMEOUT)))
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 50  # Enough keep-alive connections for concurrent bulk tools
+HTTP_MAX_KEEPALIVE = 20
+MAX_CONCURRENCY = max(1, int(os.getenv("SYNERGY_MAX_CONCURRENCY", "5")))  # Concurrent calls per bulk tool
+PREWARM_INTERVAL = int(os.getenv("SYNERGY_PREWARM_INTERVAL", "900"))  # Seconds between connection refreshes
+
+# SOAP operations with no side effects; identical concurrent calls to these are coalesced
+READ_ONLY_METHODS = frozenset({
+    "balanceQuery", "bulkCheckDomain", "bulkDomainInfo", "canRenewDomain", "checkDomain",
+    "DNSSECInformation", "domainInfo", "domainRenewRequired", "getDomainPricing",
+    "getEligibilityFields", "getInvoiceList", "getMaxYearsCanRenewFor", "getTransactionHistory",
+    "getTransferredAwayDomains", "isDomainTransferrable", "listAllRegistryHosts",
+    "listAvailableDomainExtensions", "listContacts", "listDNSSECEntries", "listDNSZone",
+    "listDomainCategories", "listDomains", "listIDProtectedContacts", "listMailForwards",
+    "listSimpleURLForwards", "lookupABNACNRBNInformation", "rawDomainContacts",
+    "registryHostInformation", "retrieveUSNexusData",
+})
+
+# Read-only operations whose successful responses are cached for CACHE_TTL seconds;
+# any write to a domain drops the cached entries for that domain and all listings
+CACHED_METHODS = frozenset({
+    "listDomains", "domainInfo", "bulkDomainInfo", "listContacts",
+    "listMailForwards", "listSimpleURLForwards", "listDNSZone",
+    "checkDomain", "canRenewDomain",
+})
+CACHE_TTL = int(os.getenv("SYNERGY_CACHE_TTL", "60"))
+# Operations whose results stay valid longer than CACHE_TTL, with their own TTL in seconds
+CACHE_TTL_OVERRIDES = {"canRenewDomain": 300}
+# Failed responses to the same operations are remembered briefly so an outage is not hammered
+NEGATIVE_CACHE_TTL = int(os.getenv("SYNERGY_NEGATIVE_CACHE_TTL", "5"))
+
+# Hot operations whose requests are rendered from a precompiled envelope template instead of
+# walking the XML schema on every call; replies are still deserialized by zeep
+TEMPLATED_METHODS = frozenset({
+    "domainInfo", "listDomains", "lockDomain", "renewDomain", "transferDomain",
+})
+
+# Operations with large list replies, which are parsed straight from the XML rather than
+# deserialized by zeep; faults and anything unexpected still go through zeep
+FAST_PARSED_METHODS = frozenset({"listDomains", "bulkDomainInfo"})
+
+# Client-side rate limit shared by every server in the process, and retry policy for throttled calls
+RATE_LIMIT_RPS = float(os.getenv("SYNERGY_RPS", "10"))
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+class _TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and wait out the returned delay"""
+
+    __slots__ = ("_rate", "_capacity", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float):
+        self._rate = rate
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds the caller must wait before using it"""
+        if self._rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+_RATE_LIMITER = _TokenBucket(RATE_LIMIT_RPS)
+
+_NS = {
+    "env": "http://schemas.xmlsoap.org/soap/envelope/",
+    "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+    "enc": "http://schemas.xmlsoap.org/soap/encoding/",
+}
+_XSI_TYPE = f"{{{_NS['xsi']}}}type"
+_XSI_NIL = f"{{{_NS['xsi']}}}nil"
+_ENC_ARRAY_TYPE = f"{{{_NS['enc']}}}arrayType"
+_XP_RETURN = etree.XPath("/env:Envelope/env:Body/*[1]/*[1]", namespaces=_NS)
+_XP_FAULT = etree.XPath("/env:Envelope/env:Body/env:Fault", namespaces=_NS)
+_REPLY_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True, collect_ids=False)
+_XSD_CONVERTERS = {
+    "int": int, "integer": int, "long": int, "short": int,
+    "float": float, "double": float,
+    "boolean": lambda text: text in ("true", "1"),
+}
+
+def _is_map_entry(element: Any) -> bool:
+    """Whether an element is a SOAP Map entry holding exactly a key and a value"""
+    return sorted(child.tag for child in element if isinstance(child.tag, str)) == ["key", "value"]
+
+def _element_value(element: Any) -> Any:
+    """Convert a SOAP-encoded element into plain dicts, lists and scalars using its xsi:type"""
+    if element.get(_XSI_NIL) in ("true", "1"):
+        return None
+
+    xsi_type = element.get(_XSI_TYPE, "")
+    type_name = xsi_type.rpartition(":")[2]
+    is_array = type_name.endswith("Array") or element.get(_ENC_ARRAY_TYPE) is not None
+    if len(element) or is_array:
+        children = [child for child in element if isinstance(child.tag, str)]
+        tags = [child.tag.rpartition("}")[2] for child in children]
+        if is_array:
+            return [_element_value(child) for child in children]
+        if type_name == "Map" or (tags and all(tag == "item" for tag in tags) and all(_is_map_entry(child) for child in children)):
+            # Apache SOAP Map: <item><key>k</key><value>v</value></item> per entry
+            return {
+                _element_value(child.find("key")): _element_value(child.find("value"))
+                for child in children
+                if child.find("key") is not None
+            }
+        if len(tags) > 1 and all(tag == "item" for tag in tags):
+            return [_element_value(child) for child in children]
+
+        # Struct; a tag that repeats collects its values into a list
+        result: Dict[str, Any] = {}
+        repeated = {tag for tag in tags if tags.count(tag) > 1}
+        for tag, child in zip(tags, children):
+            value = _element_value(child)
+            if tag in repeated:
+                result.setdefault(tag, []).append(value)
+            else:
+                result[tag] = value
+        return result
+
+    convert = _XSD_CONVERTERS.get(xsi_type.rpartition(":")[2])
+    if convert is None or element.text is None:
+        return element.text
+    try:
+        return convert(element.text)
+    except ValueError:
+        return element.text
+
+def _fast_parse(content: bytes) -> Optional[Dict[str, Any]]:
+    """Parse an RPC reply into a dict without zeep, or None if it is a fault or not understood"""
+    try:
+        envelope = etree.fromstring(content, _REPLY_PARSER)
+    except etree.XMLSyntaxError:
+        return None
+    if _XP_FAULT(envelope):
+        return None
+    returned = _XP_RETURN(envelope)
+    if not returned:
+        return None
+    result = _element_value(returned[0])
+    return result if isinstance(result, dict) else None
+
+# Hostname syntax: 1-63 character LDH labels, 253 characters total, alphabetic or punycode TLD
+_DOMAIN_RE = re.compile(
+    r"(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})",
+    re.IGNORECASE
+)
+
+def is_valid_domain(domain_name: Any) -> bool:
+    """Check domain name syntax locally, accepting internationalized names"""
+    if not isinstance(domain_name, str):
+        return False
+    if not domain_name.isascii():
+        try:
+            domain_name = domain_name.encode("idna").decode("ascii")
+        except UnicodeError:
+            return False
+    return _DOMAIN_RE.fullmatch(domain_name) is not None
+
+def domain_params(domain_name: str) -> Dict[str, str]:
+    """Build the params for the many operations that take only a domain name"""
+    return {"domainName": domain_name}
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+def _canonical_params(params: Dict[str, Any]) -> Any:
+    """Hashable, key-order independent fingerprint of request params"""
+    # Flat params (nearly every call) become a sorted item tuple; only nested ones pay for JSON
+    if all(type(value) in _SCALAR_TYPES for value in params.values()):
+        return tuple(sorted(params.items()))
+    return json.dumps(params, sort_keys=True, default=str)
+
+def _is_throttled(error: Optional[Exception] = None, result: Any = None) -> bool:
+    """Whether a failed call was rejected for exceeding the API's rate limit"""
+    if isinstance(error, TransportError):
+        return error.status_code == 429
+    if isinstance(error, Fault):
+        return "rate limit" in str(error.message).lower()
+    return isinstance(result, dict) and "rate limit" in str(result.get("error", "")).lower()
+
+# Configure logging once per process
+LOG_LEVEL_NAME = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_LEVEL = getattr(logging, LOG_LEVEL_NAME, logging.INFO)
+logging.basicConfig(
+    level=LOG_LEVEL,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+# Enable SOAP debug logging if DEBUG level
+if LOG_LEVEL == logging.DEBUG:
+    logging.getLogger('zeep.transports').setLevel(logging.DEBUG)
+    logging.getLogger('zeep.wsdl').setLevel(logging.DEBUG)
+
+def _response_expiry(key: tuple, value: Any, now: float) -> float:
+    """Expiry time for a cached response, by its operation's TTL"""
+    return now + CACHE_TTL_OVERRIDES.get(key[0], CACHE_TTL)
+
+class Credentials(NamedTuple):
+    """Effective reseller credentials for a call"""
+    reseller_id: Optional[str]
+    api_key: Optional[str]
+
+@lru_cache(maxsize=1)
+def _env_credentials() -> Credentials:
+    """Default credentials from the environment, read once; caller-supplied keys are never memoized"""
+    return Credentials(os.getenv("SYNERGY_RESELLER_ID"), os.getenv("SYNERGY_API_KEY"))
+
+def _resolve_credentials(reseller_id: Optional[str], api_key: Optional[str]) -> Credentials:
+    """Fill in missing credentials from the environment"""
+    env = _env_credentials()
+    return Credentials(reseller_id or env.reseller_id, api_key or env.api_key)
+
+def _credential_tag(reseller_id: Optional[str], api_key: Optional[str]) -> str:
+    """Short, non-reversible digest of a credential pair"""
+    return hashlib.blake2b(f"{reseller_id}:{api_key}".encode(), digest_size=8).hexdigest()
 
 class SynergyWholesaleBase:
     """Base class for Synergy Wholesale MCP servers"""
 
+    __slots__ = ("name", "version", "logger")
+
+    # SOAP clients are shared by every server instance in the process, so the WSDL is parsed once
+    _soap_client: Optional[Client] = None
+    _async_soap_client: Optional[AsyncClient] = None
+    _client_lock = threading.RLock()
+
+    # Lookups into the shared clients' parsed WSDL, likewise shared so each is resolved once per process
+    _method_cache: Dict[str, Any] = {}
+    _async_method_cache: Dict[str, Any] = {}
+    _type_cache: Dict[str, Any] = {}
+    _direct_call_methods: Set[str] = set()
+    _envelope_templates: Dict[tuple, Optional[Tuple[str, Template, Dict[str, str]]]] = {}
+
+    # Response cache and in-flight calls, shared so servers mounted in one process reuse each other's reads
+    _inflight: Dict[tuple, Future] = {}
+    _inflight_lock = threading.Lock()
+    _inflight_tasks: Set[asyncio.Task] = set()
+    _response_cache: Optional[TLRUCache] = TLRUCache(maxsize=1024, ttu=_response_expiry) if CACHE_TTL > 0 else None
+    _error_cache: Optional[TTLCache] = TTLCache(maxsize=256, ttl=NEGATIVE_CACHE_TTL) if NEGATIVE_CACHE_TTL > 0 else None
+    _response_cache_lock = threading.Lock()
+
     def __init__(self, name: str, version: str = "1.0.0"):
         """Initialize base server with logging and configuration"""
         self.name = name
         self.version = version
-        self._soap_client = None
 
-        # Configure logging
-        log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-        logging.basicConfig(
-            level=getattr(logging, log_level),
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
         self.logger = logging.getLogger(name)
-
-        # Enable SOAP debug logging if DEBUG level
-        if log_level == "DEBUG":
-            logging.getLogger('zeep.transports').setLevel(logging.DEBUG)
-            logging.getLogger('zeep.wsdl').setLevel(logging.DEBUG)
+        if LOG_LEVEL == logging.DEBUG:
             self.logger.info("SOAP debug logging enabled")
 
     def get_soap_client(self) -> Client:
         """Get or create SOAP client instance"""
         if self._soap_client is None:
-            self.logger.info("Initializing SOAP client")
-            try:
-                # Create transport with timeout
-                timeout = int(os.getenv("API_TIMEOUT", str(DEFAULT_TIMEOUT)))
-                transport = Transport(timeout=timeout)
-
-                # Create settings with non-strict mode
-                settings = Settings(
-                    strict=False,  # Allow slightly malformed XML
-                    xml_huge_tree=True,  # Support large documents
-                    forbid_dtd=False,
-                    forbid_entities=False,
-                    forbid_external=False
-                )
-
-                # Create client
-                self._soap_client = Client(
-                    WSDL_URL,
-                    transport=transport,
-                    settings=settings
-                )
-                self.logger.info(f"SOAP client initialized successfully")
-
-            except Exception as e:
-                self.logger.error(f"Failed to initialize SOAP client: {e}")
-                raise ValueError(f"Could not connect to Synergy Wholesale API: {e}")
+            # Bulk tools call in from worker threads; only one of them should build the client
+            with self._client_lock:
+                if self._soap_client is None:
+                    SynergyWholesaleBase._soap_client = self._create_soap_client()
 
         return self._soap_client
 
-    def validate_credentials(self, reseller_id: Optional[str] = None, api_key: Optional[str] = None):
+    def _create_soap_client(self) -> Client:
+        """Fetch and parse the WSDL and build the SOAP client"""
+        self.logger.info("Initializing SOAP client")
+        try:
+            # Create transport with timeout over a pooled keep-alive session
+            transport = Transport(
+                session=self._create_http_session(),
+                timeout=API_TIMEOUT,
+                cache=self._create_wsdl_cache()
+            )
+
+            # Create settings with non-strict mode
+            settings = Settings(
+                strict=False,  # Allow slightly malformed XML
+                xml_huge_tree=True,  # Support large documents
+                forbid_dtd=False,
+                forbid_entities=False,
+                forbid_external=False
+            )
+
+            # Create client
+            client = Client(
+                WSDL_URL,
+                transport=transport,
+                settings=settings
+            )
+            self.logger.info("SOAP client initialized successfully")
+            return client
+
+        except Exception as e:
+            self.logger.error("Failed to initialize SOAP client: %s", e)
+            raise ValueError(f"Could not connect to Synergy Wholesale API: {e}")
+
+    def clear_credential_cache(self):
+        """Forget resolved credentials so the environment is re-read on next use"""
+        _env_credentials.cache_clear()
+
+    def credential_tag(self, reseller_id: Optional[str] = None, api_key: Optional[str] = None) -> str:
+        """Return a log-safe tag identifying the effective credentials, for partitioning caches"""
+        return _credential_tag(*_resolve_credentials(reseller_id or None, api_key or None))
+
+    def get_async_soap_client(self) -> AsyncClient:
+        """Get or create async SOAP client, reusing the sync client's parsed WSDL"""
+        if self._async_soap_client is None:
+            with self._client_lock:
+                if self._async_soap_client is None:
+                    client = self.get_soap_client()
+                    SynergyWholesaleBase._async_soap_client = AsyncClient(
+                        client.wsdl,
+                        transport=AsyncTransport(client=self._create_async_http_client()),
+                        settings=client.settings
+                    )
+                    self.logger.info("Async SOAP client initialized successfully")
+
+        return self._async_soap_client
+
+    def _create_http_session(self) -> requests.Session:
+        """Create an HTTP session that keeps connections alive and retries failed connects"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            # urllib3 does not retry POST reads by default, so SOAP calls are never sent twice
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _create_async_http_client(self) -> httpx.AsyncClient:
+        """Create the HTTP/2 client that lets concurrent async SOAP calls share one connection"""
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=API_TIMEOUT,
+            limits=httpx.Limits(max_connections=HTTP_POOL_MAXSIZE, max_keepalive_connections=HTTP_MAX_KEEPALIVE)
+        )
+
+    @classmethod
+    async def aclose_async_client(cls):
+        """Close the shared async SOAP client's connections; call only when the server shuts down"""
+        client = cls._async_soap_client
+        if client is not None:
+            # Forget the closed client so a later call builds a fresh one
+            with cls._client_lock:
+                SynergyWholesaleBase._async_soap_client = None
+                cls._async_method_cache.clear()
+            await client.transport.aclose()
+
+    def prewarm(self):
+        """Resolve the API host and open a pooled keep-alive connection ahead of the next call"""
+        try:
+            client = self.get_soap_client()
+            client.transport.session.head(client.service._binding_options["address"], timeout=API_TIMEOUT)
+        except Exception as e:
+            self.logger.debug("Connection prewarm failed: %s", e)
+
+    async def prewarm_async(self):
+        """Async variant of prewarm for the shared async client's connection pool"""
+        try:
+            # Building the client may load the WSDL, so keep that off the event loop
+            client = await asyncio.to_thread(self.get_async_soap_client)
+            await client.transport.client.head(client.service._binding_options["address"])
+        except Exception as e:
+            self.logger.debug("Async connection prewarm failed: %s", e)
+
+    def _create_wsdl_cache(self) -> Optional[SqliteCache]:
+        """Create the on-disk WSDL cache, or None if the cache path is not writable"""
+        try:
+            os.makedirs(os.path.dirname(WSDL_CACHE_PATH), exist_ok=True)
+            return SqliteCache(path=WSDL_CACHE_PATH, timeout=WSDL_CACHE_TIMEOUT)
+        except Exception as e:
+            self.logger.warning("WSDL cache disabled, could not open %s: %s", WSDL_CACHE_PATH, e)
+            return None
+
+    def validate_credentials(self, reseller_id: Optional[str] = None, api_key: Optional[str] = None) -> Credentials:
         """Validate and return credentials from parameters or environment"""
-        final_reseller_id = reseller_id or os.getenv("SYNERGY_RESELLER_ID")
-        final_api_key = api_key or os.getenv("SYNERGY_API_KEY")
+        if reseller_id and api_key:
+            return Credentials(reseller_id, api_key)
+
+        credentials = _resolve_credentials(reseller_id or None, api_key or None)
 
-        if not final_reseller_id or not final_api_key:
+        if not credentials.reseller_id or not credentials.api_key:
             error_msg = (
                 "Missing required credentials. Please provide reseller_id and api_key parameters, "
                 "or set SYNERGY_RESELLER_ID and SYNERGY_API_KEY environment variables."
@@ -86,100 +449,193 @@ class SynergyWholesaleBase:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
 
-        return final_reseller_id, final_api_key
+        return credentials
 
     def add_auth(self, params: Dict[str, Any], reseller_id: Optional[str] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
         """Add authentication to request parameters"""
-        final_reseller_id, final_api_key = self.validate_credentials(reseller_id, api_key)
-        return {
-            "resellerID": final_reseller_id,
-            "apiKey": final_api_key,
-            **params
-        }
+        credentials = self.validate_credentials(reseller_id, api_key)
+        # Seed with credentials and update, leaving the caller's params dict untouched
+        auth_params = {"resellerID": credentials.reseller_id, "apiKey": credentials.api_key}
+        auth_params.update(params)
+        return auth_params
+
+    def _serialize_fallback(self, response: Any) -> Any:
+        """Serialize a response that is not a zeep value object"""
+        try:
+            result = helpers.serialize_object(response, target_cls=dict)
+            if isinstance(result, (dict, list)):
+                return result
+        except Exception as e:
+            self.logger.debug("Could not serialize with zeep helpers: %s", e)
+
+        # Fallback to manual extraction
+        result = {}
+        if hasattr(response, '__values__'):
+            result = dict(response.__values__)
+        elif hasattr(response, "__dict__"):
+            for k, v in response.__dict__.items():
+                if not k.startswith("_"):
+                    result[k] = v
+        else:
+            result = {"result": str(response)}
+        return result
 
     def handle_soap_response(self, response: Any) -> Dict[str, Any]:
         """Convert SOAP response to dictionary"""
-        self.logger.debug(f"Processing SOAP response: {response}")
+        self.logger.debug("Processing SOAP response: %s", response)
 
         if response is None:
             return {"error": "No response received from API"}
 
-        # Serialize zeep response object
-        try:
-            result = helpers.serialize_object(response)
-            if hasattr(result, 'items'):
-                result = dict(result)
-            self.logger.debug(f"Serialized response with {len(result)} fields")
-        except Exception as e:
-            self.logger.debug(f"Could not serialize with zeep helpers: {e}")
-            # Fallback to manual extraction
-            result = {}
-            if hasattr(response, '__values__'):
-                result = dict(response.__values__)
-            elif hasattr(response, "__dict__"):
-                for k, v in response.__dict__.items():
-                    if not k.startswith("_"):
-                        result[k] = v
-            else:
-                result = {"result": str(response)}
-
-        # Check for error status
-        if "status" in result and isinstance(result["status"], str):
-            if result["status"].startswith("ERR_"):
-                error_msg = result.get("errorMessage", "Unknown error occurred")
-                self.logger.error(f"API Error: {result['status']} - {error_msg}")
-                return {"error": error_msg, "status": result["status"], **result}
-            elif result["status"] == "OK":
-                self.logger.info(f"API call successful with status OK")
-
-        self.logger.info(f"Returning result with {len(result)} fields")
+        # Serialize zeep response object; value objects (the normal case) need no fallback
+        if isinstance(response, CompoundValue):
+            result = helpers.serialize_object(response, target_cls=dict)
+        elif isinstance(response, dict):
+            result = response
+        else:
+            result = self._serialize_fallback(response)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Serialized response with %d fields", len(result))
+
+        # Check for error status, testing the common OK case first
+        status = result.get("status") if isinstance(result, dict) else None
+        if status == "OK":
+            self.logger.info("API call successful with status OK")
+        elif isinstance(status, str) and status.startswith("ERR_"):
+            error_msg = result.get("errorMessage", "Unknown error occurred")
+            self.logger.error("API Error: %s - %s", status, error_msg)
+            result["error"] = error_msg
+            return result
+
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Returning result with %d fields", len(result))
         return result
 
-    def safe_soap_call(self, method_name: str, params: Dict[str, Any],
-                      reseller_id: Optional[str] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
-        """Safely call SOAP method with error handling"""
-        try:
-            client = self.get_soap_client()
-            method = getattr(client.service, method_name)
-
-            # Add authentication
-            auth_params = self.add_auth(params, reseller_id, api_key)
+    def _get_method(self, cache: Dict[str, Any], client: Client, method_name: str) -> Any:
+        """Get the bound service operation for a method, memoized per method name"""
+        method = cache.get(method_name)
+        if method is None:
+            method = cache.setdefault(method_name, getattr(client.service, method_name))
+        return method
+
+    def _get_request_type(self, client: Client, method_name: str) -> Any:
+        """Get the request type for a method, memoized per method name"""
+        request_type = self._type_cache.get(method_name)
+        if request_type is None:
+            request_type = self._type_cache.setdefault(
+                method_name,
+                client.get_type(f'{{urn:WholesaleSystem}}{method_name}Request')
+            )
+        return request_type
 
-            self.logger.debug(f"Calling {method_name} with params: {list(params.keys())}")
+    def _build_call_args(self, client: Client, method_name: str, params: Dict[str, Any],
+                         reseller_id: Optional[str], api_key: Optional[str]) -> Tuple[tuple, Dict[str, Any]]:
+        """Build the positional and keyword arguments for a SOAP operation call"""
+        # Add authentication
+        auth_params = self.add_auth(params, reseller_id, api_key)
 
-            # Get the request type for this method
-            request_type_name = f'{method_name}Request'
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Calling %s with params: %s", method_name, list(params))
 
+        if method_name not in self._direct_call_methods:
             try:
                 # Try to create request object
-                request_type = client.get_type(f'{{urn:WholesaleSystem}}{request_type_name}')
+                request_type = self._get_request_type(client, method_name)
                 request_obj = request_type(**auth_params)
-
+            except (ZeepLookupError, NamespaceError) as type_error:
+                # No request type in the WSDL; remember so later calls go straight to a direct call
+                self.logger.debug("No request type for %s, using direct call: %s", method_name, type_error)
+                self._direct_call_methods.add(method_name)
+            except TypeError as type_error:
+                # Request type rejects these particular params; fall back for this call only
+                self.logger.debug("Could not create request object for %s, trying direct call: %s", method_name, type_error)
+            else:
                 if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug(f"SOAP method: {method_name}")
-                    self.logger.debug(f"Request object created: {request_obj}")
-
-                response = method(request_obj)
-                self.logger.info(f"SOAP call successful for {method_name}")
+                    self.logger.debug("SOAP method: %s", method_name)
+                    self.logger.debug("Request object created: %s", request_obj)
+                return (request_obj,), {}
 
-            except Exception as type_error:
-                # Fallback: try direct call
-                self.logger.debug(f"Could not create request object for {method_name}, trying direct call: {type_error}")
-                response = method(**auth_params)
-                self.logger.info(f"SOAP call successful for {method_name} (direct call)")
+        return (), auth_params
 
-            return self.handle_soap_response(response)
+    def _get_envelope_template(self, method_name: str,
+                               fields: Tuple[str, ...]) -> Optional[Tuple[str, Template, Dict[str, str]]]:
+        """Get the address, envelope template and HTTP headers for a request, memoized per field set"""
+        key = (method_name, fields)
+        if key in self._envelope_templates:
+            return self._envelope_templates[key]
 
-        except TransportError as e:
-            self.logger.error(f"Transport/XML error in {method_name}: {e}")
+        template = None
+        try:
+            # Render the request once through zeep with a unique token per field, then turn
+            # the tokens into template placeholders so later requests skip the schema walk
+            client = self.get_soap_client()
+            tokens = {field: f"@@{field}@@" for field in fields}
+            request_obj = self._get_request_type(client, method_name)(**tokens)
+            envelope, headers = client.service._binding._create(
+                method_name, (request_obj,), {}, client=client, options=client.service._binding_options
+            )
+            text = etree_to_string(envelope).decode("utf-8").replace("$", "$$")
+            if all(text.count(token) == 1 for token in tokens.values()):
+                for field, token in tokens.items():
+                    text = text.replace(token, f"${{{field}}}")
+                template = (client.service._binding_options["address"], Template(text), dict(headers))
+        except Exception as e:
+            self.logger.debug("No envelope template for %s, using zeep: %s", method_name, e)
+
+        return self._envelope_templates.setdefault(key, template)
+
+    def _prepare_request(self, client: Client, method_name: str, params: Dict[str, Any],
+                         reseller_id: Optional[str], api_key: Optional[str]) -> Optional[Tuple[str, bytes, Dict[str, str]]]:
+        """Build the HTTP request for operations posted outside zeep's service proxy, or None"""
+        request = self._render_request(method_name, params, reseller_id, api_key)
+        if request is None and method_name in FAST_PARSED_METHODS:
+            args, kwargs = self._build_call_args(client, method_name, params, reseller_id, api_key)
+            options = client.service._binding_options
+            envelope, headers = client.service._binding._create(method_name, args, kwargs, client=client, options=options)
+            request = (options["address"], etree_to_string(envelope), headers)
+        return request
+
+    def _process_reply(self, client: Client, method_name: str, reply: Any) -> Any:
+        """Deserialize the reply to a request built by _prepare_request"""
+        if method_name in FAST_PARSED_METHODS and reply.status_code == 200:
+            result = _fast_parse(reply.content)
+            if result is not None:
+                return result
+        binding = client.service._binding
+        return binding.process_reply(client, binding.get(method_name), reply)
+
+    def _render_request(self, method_name: str, params: Dict[str, Any], reseller_id: Optional[str],
+                        api_key: Optional[str]) -> Optional[Tuple[str, bytes, Dict[str, str]]]:
+        """Render a hot operation's request from its template, or None to go through zeep"""
+        if method_name not in TEMPLATED_METHODS:
+            return None
+
+        auth_params = self.add_auth(params, reseller_id, api_key)
+        # Only plain strings and ints render the same as zeep would
+        if not all(type(value) in (str, int) for value in auth_params.values()):
+            return None
+
+        template = self._get_envelope_template(method_name, tuple(sorted(auth_params)))
+        if template is None:
+            return None
+
+        address, envelope, headers = template
+        body = envelope.substitute({field: escape(str(value)) for field, value in auth_params.items()})
+        return address, body.encode("utf-8"), headers
+
+    def _call_error(self, method_name: str, e: Exception) -> Dict[str, Any]:
+        """Convert an exception raised during a SOAP call into an error dictionary"""
+        if isinstance(e, TransportError):
+            self.logger.error("Transport/XML error in %s: %s", method_name, e)
             return {
                 "error": f"Transport error: {e}",
                 "method": method_name,
                 "suggestion": "Check network connectivity and API endpoint"
             }
 
-        except Fault as e:
-            self.logger.error(f"SOAP Fault in {method_name}: {e}")
+        if isinstance(e, Fault):
+            self.logger.error("SOAP Fault in %s: %s", method_name, e)
             fault_detail = {
                 "error": f"SOAP Fault: {e.message if hasattr(e, 'message') else str(e)}",
                 "method": method_name
@@ -190,6 +646,333 @@ class SynergyWholesaleBase:
                 fault_detail["fault_detail"] = str(e.detail)
             return fault_detail
 
-        except Exception as e:
-            self.logger.error(f"Unexpected error calling {method_name}: {e}")
-            return {"error": str(e), "method": method_name, "error_type": type(e).__name__}
\ No newline at end of file
+        self.logger.error("Unexpected error calling %s: %s", method_name, e)
+        return {"error": str(e), "method": method_name, "error_type": type(e).__name__}
+
+    def _request_key(self, method_name: str, params: Dict[str, Any],
+                     reseller_id: Optional[str], api_key: Optional[str]) -> tuple:
+        """Identify a read-only call by method, canonical params, credentials and the domains it covers"""
+        domains = params.get("domainNameList") or params.get("domainList") or [params.get("domainName")]
+        return (
+            method_name,
+            _canonical_params(params),
+            self.credential_tag(reseller_id, api_key),
+            frozenset(domain.lower() for domain in domains if isinstance(domain, str))
+        )
+
+    def _cached_response(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a still-fresh cached response or recent failure for a request key, if any"""
+        if key[0] not in CACHED_METHODS:
+            return None
+        with self._response_cache_lock:
+            for cache in (self._response_cache, self._error_cache):
+                result = cache.get(key) if cache is not None else None
+                if result is not None:
+                    # A copy, so a caller that edits its result cannot change the cached one
+                    return dict(result)
+        return None
+
+    def _store_response(self, key: tuple, result: Dict[str, Any]):
+        """Cache a response to a cacheable read-only call; failures go to the short-lived error cache"""
+        if key[0] not in CACHED_METHODS:
+            return
+        cache = self._error_cache if "error" in result else self._response_cache
+        if cache is None:
+            return
+        with self._response_cache_lock:
+            cache[key] = result
+
+    def _drop_cached(self, domain: str, include_listings: bool):
+        """Drop cached responses and failures covering a domain, and optionally every listing"""
+        with self._response_cache_lock:
+            for cache in (self._response_cache, self._error_cache):
+                if cache is None:
+                    continue
+                stale = [key for key in cache if domain in key[3] or (include_listings and not key[3])]
+                for key in stale:
+                    del cache[key]
+
+    def _invalidate_responses(self, params: Dict[str, Any]):
+        """Drop cached responses a write may have made stale: the domain's own and every listing"""
+        domain = params.get("domainName")
+        if domain:
+            self._drop_cached(domain.lower(), include_listings=True)
+
+    def invalidate_call(self, method_name: str, params: Dict[str, Any],
+                        reseller_id: Optional[str] = None, api_key: Optional[str] = None):
+        """Drop the cached response to one call, leaving the domain's other cached entries alone"""
+        key = self._request_key(method_name, params, reseller_id, api_key)
+        with self._response_cache_lock:
+            for cache in (self._response_cache, self._error_cache):
+                if cache is not None:
+                    cache.pop(key, None)
+
+    def invalidate_domain(self, domain_name: str):
+        """Drop every cached response covering a domain, so the next read goes to the API"""
+        self._drop_cached(domain_name.lower(), include_listings=False)
+
+    def _invalid_params(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reject obviously malformed params before spending a SOAP round trip on them"""
+        domain_name = params.get("domainName")
+        if domain_name is not None and not is_valid_domain(domain_name):
+            return {"error": f"Invalid domain name: {domain_name}"}
+        return None
+
+    def _join_inflight(self, key: tuple) -> Tuple[Future, bool]:
+        """Return the in-flight future for a key and whether this caller registered it and must make the call"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = self._inflight[key] = Future()
+            return future, True
+
+    def _finish_inflight(self, key: tuple, future: Future, result: Dict[str, Any]):
+        """Cache a coalesced call's result and release the callers waiting on it"""
+        # The leader keeps its own dict; the cache and the waiting callers share a snapshot
+        # that each waiter copies in turn, so no caller's edits reach another's result
+        shared = dict(result)
+        self._store_response(key, shared)
+        with self._inflight_lock:
+            del self._inflight[key]
+        future.set_result(shared)
+
+    def _abandon_inflight(self, key: tuple, future: Future):
+        """Drop a coalesced call that was interrupted, so its waiting callers retry it themselves"""
+        with self._inflight_lock:
+            del self._inflight[key]
+        future.cancel()
+
+    def safe_soap_call(self, method_name: str, params: Dict[str, Any],
+                      reseller_id: Optional[str] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
+        """Safely call SOAP method with error handling"""
+        invalid = self._invalid_params(params)
+        if invalid is not None:
+            return invalid
+
+        if method_name not in READ_ONLY_METHODS:
+            result = self._soap_call(method_name, params, reseller_id, api_key)
+            self._invalidate_responses(params)
+            return result
+
+        key = self._request_key(method_name, params, reseller_id, api_key)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        # Coalesce identical read-only calls: later callers wait on the first caller's result
+        while True:
+            future, is_leader = self._join_inflight(key)
+            if is_leader:
+                break
+            self.logger.debug("Joining in-flight %s call", method_name)
+            try:
+                return dict(future.result())
+            except FutureCancelledError:
+                # The leader was interrupted before it got a result; make the call ourselves
+                continue
+
+        try:
+            result = self._soap_call(method_name, params, reseller_id, api_key)
+        except BaseException:
+            self._abandon_inflight(key, future)
+            raise
+        self._finish_inflight(key, future, result)
+        return result
+
+    def _retry_delay(self, method_name: str, attempt: int,
+                     error: Optional[Exception] = None, result: Any = None) -> Optional[float]:
+        """Backoff before retrying a failed call, or None if it should not be retried"""
+        if attempt + 1 >= RETRY_ATTEMPTS:
+            return None
+        # Throttled calls were rejected, so any call may be retried; other transport
+        # errors are only retried for read-only calls, which are safe to repeat
+        if not (_is_throttled(error, result)
+                or (isinstance(error, TransportError) and method_name in READ_ONLY_METHODS)):
+            return None
+        return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+
+    def _soap_call(self, method_name: str, params: Dict[str, Any],
+                   reseller_id: Optional[str], api_key: Optional[str]) -> Dict[str, Any]:
+        """Call a SOAP method, converting any failure into an error dictionary"""
+        attempt = 0
+        while True:
+            wait = _RATE_LIMITER.reserve()
+            if wait:
+                time.sleep(wait)
+            try:
+                client = self.get_soap_client()
+                request = self._prepare_request(client, method_name, params, reseller_id, api_key)
+                if request is not None:
+                    reply = client.transport.post(*request)
+                    response = self._process_reply(client, method_name, reply)
+                    self.logger.info("SOAP call successful for %s", method_name)
+                else:
+                    method = self._get_method(self._method_cache, client, method_name)
+                    args, kwargs = self._build_call_args(client, method_name, params, reseller_id, api_key)
+
+                    response = method(*args, **kwargs)
+                    self.logger.info("SOAP call successful for %s%s", method_name, "" if args else " (direct call)")
+
+                result = self.handle_soap_response(response)
+                delay = self._retry_delay(method_name, attempt, result=result)
+                if delay is None:
+                    return result
+            except Exception as e:
+                delay = self._retry_delay(method_name, attempt, error=e)
+                if delay is None:
+                    return self._call_error(method_name, e)
+
+            self.logger.warning("Retrying %s in %.1fs (attempt %d of %d)", method_name, delay, attempt + 2, RETRY_ATTEMPTS)
+            time.sleep(delay)
+            attempt += 1
+
+    async def safe_soap_call_async(self, method_name: str, params: Dict[str, Any],
+                                   reseller_id: Optional[str] = None, api_key: Optional[str] = None) -> Dict[str, Any]:
+        """Async variant of safe_soap_call that does not block the event loop"""
+        invalid = self._invalid_params(params)
+        if invalid is not None:
+            return invalid
+
+        if method_name not in READ_ONLY_METHODS:
+            result = await self._soap_call_async(method_name, params, reseller_id, api_key)
+            self._invalidate_responses(params)
+            return result
+
+        key = self._request_key(method_name, params, reseller_id, api_key)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+
+        # Shares the in-flight table with safe_soap_call, so sync and async callers coalesce too
+        while True:
+            future, is_leader = self._join_inflight(key)
+            if is_leader:
+                break
+            self.logger.debug("Joining in-flight %s call", method_name)
+            try:
+                # Shielded so a cancelled follower does not cancel the shared future for the others
+                return dict(await asyncio.shield(asyncio.wrap_future(future)))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leader was interrupted before it got a result; make the call ourselves
+
+        # The call runs in its own task, so cancelling the caller that started it leaves it
+        # running for everyone else waiting on the same key
+        task = asyncio.ensure_future(self._lead_inflight_async(key, future, method_name, params, reseller_id, api_key))
+        self._inflight_tasks.add(task)
+        task.add_done_callback(self._inflight_tasks.discard)
+        return await asyncio.shield(task)
+
+    async def _lead_inflight_async(self, key: tuple, future: Future, method_name: str, params: Dict[str, Any],
+                                   reseller_id: Optional[str], api_key: Optional[str]) -> Dict[str, Any]:
+        """Make a coalesced async call and hand its result to the callers waiting on it"""
+        try:
+            result = await self._soap_call_async(method_name, params, reseller_id, api_key)
+        except BaseException:
+            self._abandon_inflight(key, future)
+            raise
+        self._finish_inflight(key, future, result)
+        return result
+
+    async def _soap_call_async(self, method_name: str, params: Dict[str, Any],
+                               reseller_id: Optional[str], api_key: Optional[str]) -> Dict[str, Any]:
+        """Call a SOAP method without blocking, converting any failure into an error dictionary"""
+        attempt = 0
+        while True:
+            wait = _RATE_LIMITER.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                client = self._async_soap_client
+                if client is None:
+                    # The first call builds the client, which loads the WSDL; keep that off the event loop
+                    client = await asyncio.to_thread(self.get_async_soap_client)
+                request = self._prepare_request(client, method_name, params, reseller_id, api_key)
+                if request is not None:
+                    reply = client.transport.new_response(await client.transport.post(*request))
+                    response = self._process_reply(client, method_name, reply)
+                    self.logger.info("Async SOAP call successful for %s", method_name)
+                else:
+                    method = self._get_method(self._async_method_cache, client, method_name)
+                    args, kwargs = self._build_call_args(client, method_name, params, reseller_id, api_key)
+
+                    response = await method(*args, **kwargs)
+                    self.logger.info("Async SOAP call successful for %s%s", method_name, "" if args else " (direct call)")
+
+                result = self.handle_soap_response(response)
+                delay = self._retry_delay(method_name, attempt, result=result)
+                if delay is None:
+                    return result
+            except Exception as e:
+                delay = self._retry_delay(method_name, attempt, error=e)
+                if delay is None:
+                    return self._call_error(method_name, e)
+
+            self.logger.warning("Retrying %s in %.1fs (attempt %d of %d)", method_name, delay, attempt + 2, RETRY_ATTEMPTS)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def bulk_preflight(self, domain_names: Iterable[str], reseller_id: Optional[str] = None,
+                             api_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up many domains with a single bulkDomainInfo call before acting on them.
+
+        Returns each domain's info keyed by lowercased domain name, or an empty dict if the
+        bulk lookup itself failed, in which case callers should skip their preflight checks.
+        """
+        names = list(domain_names)
+        if not names:
+            return {}
+
+        result = await self.safe_soap_call_async("bulkDomainInfo", {"domainList": names}, reseller_id, api_key)
+        if "error" in result:
+            self.logger.warning("Bulk preflight skipped, bulkDomainInfo failed: %s", result["error"])
+            return {}
+
+        return {
+            str(info.get("domainName", "")).lower(): info
+            for info in result.get("domainList") or []
+            if isinstance(info, dict)
+        }
+
+_prewarm_task: Optional[asyncio.Task] = None
+
+async def _keep_connections_warm():
+    """Refresh both clients' pooled API connections every PREWARM_INTERVAL seconds"""
+    base = SynergyWholesaleBase("SynergyPrewarm")
+    while True:
+        await asyncio.to_thread(base.prewarm)
+        await base.prewarm_async()
+        await asyncio.sleep(PREWARM_INTERVAL)
+
+@asynccontextmanager
+async def async_client_lifespan(server: Any) -> AsyncIterator[None]:
+    """FastMCP lifespan that keeps API connections warm and closes the shared async SOAP client when the server stops"""
+    global _prewarm_task
+    # Mounted servers each run this lifespan; only the first one starts the process-wide prewarm task
+    owns_prewarm = PREWARM_INTERVAL > 0 and _prewarm_task is None
+    if owns_prewarm:
+        _prewarm_task = asyncio.create_task(_keep_connections_warm())
+    try:
+        yield
+    finally:
+        if owns_prewarm:
+            _prewarm_task.cancel()
+            _prewarm_task = None
+        await SynergyWholesaleBase.aclose_async_client()
+
+async def gather_bounded(calls: Iterable[Awaitable[Dict[str, Any]]], limit: int = MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+    """Await SOAP calls concurrently, at most `limit` at a time, returning results in order"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        async with semaphore:
+            return await call
+
+    results = await asyncio.gather(*(bounded(call) for call in calls), return_exceptions=True)
+    return [
+        {"error": str(result), "error_type": type(result).__name__} if isinstance(result, Exception) else result
+        for result in results
+    ]
@@ -6,25 +6,29 @@ Provides tools for account management and diagnostic utilities
 
 import sys
 import os
+import asyncio
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
 
 # Add shared module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
 from fastmcp import FastMCP
-from base_server import SynergyWholesaleBase
+from base_server import SynergyWholesaleBase, async_client_lifespan
 
 # Initialize FastMCP server
 mcp = FastMCP(
     name="Synergy Wholesale Account",
     version="1.0.0",
+    lifespan=async_client_lifespan,
     instructions="""
     This server provides account management and utility tools for Synergy Wholesale.
 
     Key features:
     - Account balance checking
     - Transaction history
+    - Combined account overview (balance, transactions, invoices)
     - Invoice management
     - Domain renewal checks
     - ICANN verification
@@ -86,12 +90,12 @@ def get_transaction_history(
         Dictionary with transaction history
     """
     # Calculate date range
-    end_date = datetime.now()
+    end_date = date.today()
     start_date = end_date - timedelta(days=days)
 
     return base.safe_soap_call("getTransactionHistory", {
-        "startDate": start_date.strftime("%Y-%m-%d"),
-        "endDate": end_date.strftime("%Y-%m-%d"),
+        "startDate": start_date.isoformat(),
+        "endDate": end_date.isoformat(),
         "limit": limit
     }, reseller_id, api_key)
 
@@ -119,13 +123,52 @@ def get_invoice_list(
     if year:
         params["year"] = year
     else:
-        params["year"] = datetime.now().year
+        params["year"] = date.today().year
 
     if month and 1 <= month <= 12:
         params["month"] = month
 
     return base.safe_soap_call("getInvoiceList", params, reseller_id, api_key)
 
+@mcp.tool()
+async def get_account_overview(
+    days: int = 30,
+    reseller_id: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get balance, recent transactions and this year's invoices in one call.
+
+    The three API queries run concurrently, so this takes about as long as
+    the slowest of them rather than their sum.
+
+    Args:
+        days: Number of days of transaction history to include (default 30)
+        reseller_id: Optional Synergy Wholesale reseller ID
+        api_key: Optional Synergy Wholesale API key
+
+    Returns:
+        Dictionary with balance, transactions and invoices results
+    """
+    end_date = date.today()
+    start_date = end_date - timedelta(days=days)
+
+    balance, transactions, invoices = await asyncio.gather(
+        base.safe_soap_call_async("balanceQuery", {}, reseller_id, api_key),
+        base.safe_soap_call_async("getTransactionHistory", {
+            "startDate": start_date.isoformat(),
+            "endDate": end_date.isoformat(),
+            "limit": 100
+        }, reseller_id, api_key),
+        base.safe_soap_call_async("getInvoiceList", {"year": end_date.year}, reseller_id, api_key)
+    )
+
+    return {
+        "balance": balance,
+        "transactions": transactions,
+        "invoices": invoices
+    }
+
 # ============================================================================
 # DOMAIN RENEWAL MANAGEMENT
 # ============================================================================
@@ -190,12 +233,12 @@ def get_transfer_away_list(
         Dictionary with list of transferred domains
     """
     # Calculate date range
-    end_date = datetime.now()
+    end_date = date.today()
     start_date = end_date - timedelta(days=days)
 
     return base.safe_soap_call("getTransferredAwayDomains", {
-        "startDate": start_date.strftime("%Y-%m-%d"),
-        "endDate": end_date.strftime("%Y-%m-%d")
+        "startDate": start_date.isoformat(),
+        "endDate": end_date.isoformat()
     }, reseller_id, api_key)
 
 # ============================================================================
@@ -246,19 +289,20 @@ def test_api_connectivity(
         # Test basic connectivity by calling balance query
         base.logger.info("Testing API connectivity...")
         result = base.safe_soap_call("balanceQuery", {}, reseller_id, api_key)
+        endpoint = base.get_soap_client().wsdl.location
 
         if "error" in result:
             return {
                 "status": "error",
                 "message": result["error"],
-                "api_endpoint": base.get_soap_client().wsdl.location,
+                "api_endpoint": endpoint,
                 "suggestion": "Check your credentials and IP whitelist settings"
             }
 
         return {
             "status": "connected",
             "message": "API connection successful",
-            "api_endpoint": base.get_soap_client().wsdl.location,
+            "api_endpoint": endpoint,
             "api_version": "v3.11",
             "account_balance": result.get("balance"),
             "timestamp": datetime.now().isoformat()
@@ -273,6 +317,25 @@ def test_api_connectivity(
             "suggestion": "Verify network connectivity and WSDL availability"
         }
 
+# Known API limits; static, so built once and frozen. Tool results must be plain dicts, so
+# get_api_limits hands out a two-level copy rather than the proxy itself
+_API_LIMITS = MappingProxyType({
+    "rate_limits": MappingProxyType({
+        "requests_per_second": 10,
+        "requests_per_minute": 100,
+        "requests_per_hour": 1000,
+        "bulk_domain_check_limit": 30,
+        "bulk_domain_info_limit": 50,
+        "bulk_transfer_limit": 10,
+        "bulk_register_limit": 10
+    }),
+    "timeout_seconds": 30,
+    "max_nameservers": 6,
+    "min_nameservers": 2,
+    "max_domain_years": 10,
+    "note": "These are general limits. Actual limits may vary based on your account."
+})
+
 @mcp.tool()
 def get_api_limits(
     reseller_id: Optional[str] = None,
@@ -290,22 +353,7 @@ def get_api_limits(
     """
     # This might need to be mapped to a specific API call or might return static limits
     # For now, return known limits
-    return {
-        "rate_limits": {
-            "requests_per_second": 10,
-            "requests_per_minute": 100,
-            "requests_per_hour": 1000,
-            "bulk_domain_check_limit": 30,
-            "bulk_domain_info_limit": 50,
-            "bulk_transfer_limit": 10,
-            "bulk_register_limit": 10
-        },
-        "timeout_seconds": 30,
-        "max_nameservers": 6,
-        "min_nameservers": 2,
-        "max_domain_years": 10,
-        "note": "These are general limits. Actual limits may vary based on your account."
-    }
+    return {**_API_LIMITS, "rate_limits": dict(_API_LIMITS["rate_limits"])}
 
 # ============================================================================
 # MAIN ENTRY POINT
@@ -319,5 +367,11 @@ if __name__ == "__main__":
         base.logger.info("No environment credentials found - dynamic credentials mode enabled")
         base.logger.info("Tools will require reseller_id and api_key parameters")
 
+    # Build the SOAP client (WSDL fetch + parse) at boot instead of on the first tool call
+    try:
+        base.get_soap_client()
+    except ValueError as e:
+        base.logger.warning("SOAP client not initialized at startup, will retry on first call: %s", e)
+
     # Run the server
     mcp.run()
\ No newline at end of file
@@ -6,6 +6,7 @@ Provides tools for advanced features, DNSSEC, glue records, categories, and .AU
 
 import sys
 import os
+import re
 from typing import Dict, Any, List, Optional
 
 # Add shared module to path
@@ -455,6 +456,36 @@ def list_domain_categories(
 # .AU SPECIFIC OPERATIONS
 # ============================================================================
 
+# ABNs and ACNs are fixed-length digit strings; RBNs vary by state (e.g. "VIC B123456U")
+_BUSINESS_NUMBER_PATTERNS = {
+    "ABN": re.compile(r"\d{11}"),
+    "ACN": re.compile(r"\d{9}")
+}
+_ABN_WEIGHTS = (10, 1, 3, 5, 7, 9, 11, 13, 15, 17, 19)
+
+def _abn_checksum_valid(abn: str) -> bool:
+    """Check an 11-digit ABN against the ATO modulus 89 checksum."""
+    digits = [int(c) for c in abn]
+    digits[0] -= 1
+    return sum(weight * digit for weight, digit in zip(_ABN_WEIGHTS, digits)) % 89 == 0
+
+def _normalize_business_number(value: str, number_type: str) -> Dict[str, Any]:
+    """
+    Strip spacing from an ABN/ACN and check its format locally.
+
+    Returns {"value": normalized} or {"error": message}. RBNs are passed through unchanged.
+    """
+    pattern = _BUSINESS_NUMBER_PATTERNS.get(number_type)
+    if pattern is None:
+        return {"value": value}
+
+    digits = value.replace(" ", "")
+    if not pattern.fullmatch(digits):
+        return {"error": f"Invalid {number_type} format: {value}"}
+    if number_type == "ABN" and not _abn_checksum_valid(digits):
+        return {"error": "Invalid ABN: checksum does not match"}
+    return {"value": digits}
+
 @mcp.tool()
 def get_abn_acn_rbn_info(
     lookup_value: str,
@@ -477,8 +508,12 @@ def get_abn_acn_rbn_info(
     if lookup_type not in ["ABN", "ACN", "RBN"]:
         return {"error": "lookup_type must be 'ABN', 'ACN', or 'RBN'"}
 
+    normalized = _normalize_business_number(lookup_value, lookup_type)
+    if "error" in normalized:
+        return normalized
+
     return base.safe_soap_call("lookupABNACNRBNInformation", {
-        "lookupValue": lookup_value,
+        "lookupValue": normalized["value"],
         "lookupType": lookup_type
     }, reseller_id, api_key)
 
@@ -501,8 +536,12 @@ def generate_au_eligibility(
     Returns:
         Dictionary with generated eligibility data
     """
+    normalized = _normalize_business_number(business_number, business_type.upper())
+    if "error" in normalized:
+        return normalized
+
     return base.safe_soap_call("generateAUEligibilityFromBusinessNumber", {
-        "businessNumber": business_number,
+        "businessNumber": normalized["value"],
         "businessType": business_type
     }, reseller_id, api_key)
 
@@ -588,5 +627,11 @@ if __name__ == "__main__":
         base.logger.info("No environment credentials found - dynamic credentials mode enabled")
         base.logger.info("Tools will require reseller_id and api_key parameters")
 
+    # Build the SOAP client (WSDL fetch + parse) at boot instead of on the first tool call
+    try:
+        base.get_soap_client()
+    except ValueError as e:
+        base.logger.warning("SOAP client not initialized at startup, will retry on first call: %s", e)
+
     # Run the server
     mcp.run()
\ No newline at end of file
@@ -6,25 +6,31 @@ Provides tools for checking domain availability and registering domains
 
 import sys
 import os
+import json
+import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 # Add shared module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
+from cachetools import TTLCache
 from fastmcp import FastMCP
-from base_server import SynergyWholesaleBase
+from base_server import MAX_CONCURRENCY, SynergyWholesaleBase, async_client_lifespan, domain_params, is_valid_domain
 
 # Initialize FastMCP server - MUST be at module level for FastMCP Cloud
 mcp = FastMCP(
     name="Synergy Wholesale Discovery",
     version="1.0.0",
+    lifespan=async_client_lifespan,
     instructions="""
     This server provides domain discovery and registration tools for Synergy Wholesale.
 
     Key features:
     - Check domain availability (single and bulk)
-    - Get domain pricing for all TLDs
+    - Get domain pricing for all TLDs or a single TLD
     - Check TLD-specific requirements
     - Register domains (single and bulk)
     - Check if domains need renewal
@@ -43,10 +49,11 @@ base = SynergyWholesaleBase("SynergyDiscovery")
 # ============================================================================
 
 @mcp.tool()
-def check_domain(
+async def check_domain(
     domain_name: str,
     reseller_id: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Check if a domain is available for registration.
@@ -55,14 +62,18 @@ def check_domain(
         domain_name: The domain name to check (e.g., "example.com")
         reseller_id: Optional Synergy Wholesale reseller ID (falls back to env var)
         api_key: Optional Synergy Wholesale API key (falls back to env var)
+        force_refresh: Bypass the cached availability (cached for SYNERGY_CACHE_TTL seconds, default 60)
 
     Returns:
         Dictionary with availability status and pricing information
     """
-    return base.safe_soap_call("checkDomain", {"domainName": domain_name}, reseller_id, api_key)
+    params = domain_params(domain_name)
+    if force_refresh:
+        base.invalidate_call("checkDomain", params, reseller_id, api_key)
+    return await base.safe_soap_call_async("checkDomain", params, reseller_id, api_key)
 
 @mcp.tool()
-def bulk_check_domain(
+async def bulk_check_domain(
     domain_names: List[str],
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -78,13 +89,41 @@ def bulk_check_domain(
     Returns:
         Dictionary with availability status for each domain
     """
-    if len(domain_names) > 30:
+    if not domain_names:
+        return {"error": "At least one domain name must be provided"}
+
+    # Drop duplicates (keeping order) so repeated names are not checked twice
+    unique_names = list(dict.fromkeys(domain_names))
+    if len(unique_names) > 30:
         return {"error": "Maximum 30 domains can be checked at once"}
 
-    return base.safe_soap_call("bulkCheckDomain", {"domainNameList": domain_names}, reseller_id, api_key)
+    invalid = [name for name in unique_names if not is_valid_domain(name)]
+    if invalid:
+        return {"error": f"Invalid domain names: {', '.join(invalid)}"}
+
+    return await base.safe_soap_call_async("bulkCheckDomain", {"domainNameList": unique_names}, reseller_id, api_key)
+
+# Cache for domain pricing, per credential set, expiring after PRICING_CACHE_TTL seconds
+PRICING_CACHE_TTL = int(os.getenv("PRICING_CACHE_TTL", "3600"))
+_pricing_cache = TTLCache(maxsize=16, ttl=PRICING_CACHE_TTL)
+_pricing_cache_lock = threading.Lock()
 
-# Cache for domain pricing
-_pricing_cache = {}
+def _pricing_columns(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the per-TLD pricing rows into parallel per-field lists (tld, renew, ...)."""
+    rows = result.get("pricing")
+    if not isinstance(rows, list) or not rows:
+        return result
+
+    fields = dict.fromkeys(field for row in rows for field in row)
+    return {**result, "pricing": {field: [row.get(field) for row in rows] for field in fields}}
+
+def _pricing_row(columns: Dict[str, List[Any]], tld: str) -> Optional[Dict[str, Any]]:
+    """Pick a single TLD's pricing out of the columnar pricing data, or None if not listed."""
+    target = tld.lower().lstrip(".")
+    for index, listed_tld in enumerate(columns.get("tld", [])):
+        if str(listed_tld).lower().lstrip(".") == target:
+            return {field: values[index] for field, values in columns.items()}
+    return None
 
 @mcp.tool()
 def get_domain_pricing(
@@ -98,24 +137,121 @@ def get_domain_pricing(
     Args:
         reseller_id: Optional Synergy Wholesale reseller ID (falls back to env var)
         api_key: Optional Synergy Wholesale API key (falls back to env var)
-        force_refresh: Force refresh of cached pricing data
+        force_refresh: Force refresh of cached pricing data (cached for PRICING_CACHE_TTL seconds, default 1 hour)
 
     Returns:
-        Dictionary with pricing information for each TLD
+        Dictionary whose "pricing" holds parallel lists per field: "tld" lists the TLDs,
+        and e.g. pricing["renew"][i] is the renewal price of pricing["tld"][i]
     """
-    if force_refresh or "pricing" not in _pricing_cache:
-        result = base.safe_soap_call("getDomainPricing", {}, reseller_id, api_key)
-        if "error" not in result:
-            _pricing_cache["pricing"] = result
-            _pricing_cache["timestamp"] = datetime.now().isoformat()
-            return result
-    return _pricing_cache.get("pricing", {"error": "No pricing data available"})
+    cache_key = base.credential_tag(reseller_id, api_key)
+    with _pricing_cache_lock:
+        cached = _pricing_cache.get(cache_key)
+    # Cached pricing is handed out as a copy, so a caller's edits cannot leak into the cache
+    if cached is not None and not force_refresh:
+        return dict(cached)
+
+    result = base.safe_soap_call("getDomainPricing", {}, reseller_id, api_key)
+    if "error" in result:
+        # Fall back to still-valid cached pricing if a forced refresh fails
+        return dict(cached) if cached is not None else result
+
+    result = _pricing_columns(result)
+    with _pricing_cache_lock:
+        _pricing_cache[cache_key] = result
+    return dict(result)
 
 @mcp.tool()
-def get_domain_eligibility_fields(
+def get_tld_pricing(
     tld: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get pricing for a single TLD.
+
+    Args:
+        tld: The TLD to price (e.g., "com.au", "com")
+        reseller_id: Optional Synergy Wholesale reseller ID (falls back to env var)
+        api_key: Optional Synergy Wholesale API key (falls back to env var)
+
+    Returns:
+        Dictionary with the TLD's registration, renewal and transfer pricing
+    """
+    pricing = get_domain_pricing(reseller_id, api_key)
+    if "error" in pricing:
+        return pricing
+
+    row = _pricing_row(pricing.get("pricing") or {}, tld)
+    if row is None:
+        return {"error": f"No pricing found for TLD: {tld}"}
+    return row
+
+# Near-static reference data, cached for a day and persisted so it survives restarts
+REFERENCE_CACHE_TTL = 86400
+REFERENCE_CACHE_DIR = os.path.expanduser(os.getenv("SYNERGY_CACHE_DIR", "~/.cache/synergy-mcp"))
+_eligibility_cache = TTLCache(maxsize=256, ttl=REFERENCE_CACHE_TTL)
+_extensions_cache = TTLCache(maxsize=4, ttl=REFERENCE_CACHE_TTL)
+_reference_cache_lock = threading.Lock()
+
+def _load_reference_cache(cache: TTLCache, name: str):
+    """Fill a reference cache from its file on disk, skipping entries older than the TTL"""
+    try:
+        with open(os.path.join(REFERENCE_CACHE_DIR, f"{name}.json")) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return
+
+    cutoff = time.time() - REFERENCE_CACHE_TTL
+    for key, (fetched_at, result) in entries.items():
+        if fetched_at > cutoff:
+            cache[key] = (fetched_at, result)
+
+def _save_reference_cache(cache: TTLCache, name: str):
+    """Write a reference cache to disk; must be called with _reference_cache_lock held"""
+    path = os.path.join(REFERENCE_CACHE_DIR, f"{name}.json")
+    try:
+        os.makedirs(REFERENCE_CACHE_DIR, exist_ok=True)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(dict(cache.items()), f, default=str)
+        os.replace(f"{path}.tmp", path)
+    except (OSError, TypeError) as e:
+        base.logger.warning("Could not persist %s cache to %s: %s", name, path, e)
+
+def _cached_reference_call(
+    cache: TTLCache,
+    name: str,
+    cache_key: str,
+    method_name: str,
+    params: Dict[str, Any],
+    reseller_id: Optional[str],
+    api_key: Optional[str],
+    force_refresh: bool
+) -> Dict[str, Any]:
+    """Call a reference-data SOAP method, serving successful results from cache."""
+    if not force_refresh:
+        with _reference_cache_lock:
+            entry = cache.get(cache_key)
+        # Entries loaded from disk keep their original fetch time, so age them by that, not the TTLCache clock
+        if entry is not None and time.time() - entry[0] < REFERENCE_CACHE_TTL:
+            return dict(entry[1])
+
+    result = base.safe_soap_call(method_name, params, reseller_id, api_key)
+    if "error" not in result:
+        with _reference_cache_lock:
+            cache[cache_key] = (time.time(), result)
+            _save_reference_cache(cache, name)
+        return dict(result)
+    return result
+
+_load_reference_cache(_eligibility_cache, "eligibility")
+_load_reference_cache(_extensions_cache, "extensions")
+
+@mcp.tool()
+def get_domain_eligibility_fields(
+    tld: str,
+    reseller_id: Optional[str] = None,
+    api_key: Optional[str] = None,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Get eligibility requirements for a specific TLD.
@@ -124,16 +260,20 @@ def get_domain_eligibility_fields(
         tld: The TLD to check (e.g., "au", "com.au", "us")
         reseller_id: Optional Synergy Wholesale reseller ID (falls back to env var)
         api_key: Optional Synergy Wholesale API key (falls back to env var)
+        force_refresh: Force refresh of cached eligibility fields (cached for 24 hours)
 
     Returns:
         Dictionary with eligibility fields required for the TLD
     """
-    return base.safe_soap_call("getEligibilityFields", {"tld": tld}, reseller_id, api_key)
+    cache_key = f"{tld.lower()}:{base.credential_tag(reseller_id, api_key)}"
+    return _cached_reference_call(_eligibility_cache, "eligibility", cache_key, "getEligibilityFields",
+                                  {"tld": tld}, reseller_id, api_key, force_refresh)
 
 @mcp.tool()
 def list_available_extensions(
     reseller_id: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     List all available domain extensions (TLDs).
@@ -141,17 +281,20 @@ def list_available_extensions(
     Args:
         reseller_id: Optional Synergy Wholesale reseller ID (falls back to env var)
         api_key: Optional Synergy Wholesale API key (falls back to env var)
+        force_refresh: Force refresh of the cached extension list (cached for 24 hours)
 
     Returns:
         Dictionary with list of available TLDs and their properties
     """
-    return base.safe_soap_call("listAvailableDomainExtensions", {}, reseller_id, api_key)
+    return _cached_reference_call(_extensions_cache, "extensions", base.credential_tag(reseller_id, api_key),
+                                  "listAvailableDomainExtensions", {}, reseller_id, api_key, force_refresh)
 
 @mcp.tool()
-def determine_domain_renewable(
+async def determine_domain_renewable(
     domain_name: str,
     reseller_id: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Check if a domain needs renewal.
@@ -160,16 +303,52 @@ def determine_domain_renewable(
         domain_name: The domain name to check
         reseller_id: Optional Synergy Wholesale reseller ID (falls back to env var)
         api_key: Optional Synergy Wholesale API key (falls back to env var)
+        force_refresh: Bypass the cached renewability (cached for 5 minutes)
 
     Returns:
         Dictionary with renewal status and expiry information
     """
-    return base.safe_soap_call("canRenewDomain", {"domainName": domain_name}, reseller_id, api_key)
+    params = domain_params(domain_name)
+    if force_refresh:
+        base.invalidate_call("canRenewDomain", params, reseller_id, api_key)
+    return await base.safe_soap_call_async("canRenewDomain", params, reseller_id, api_key)
 
 # ============================================================================
 # DOMAIN REGISTRATION TOOLS
 # ============================================================================
 
+def _registration_params(
+    domain_name: str,
+    years: int,
+    nameservers: List[str],
+    registrant_contact: Dict[str, str],
+    technical_contact: Optional[Dict[str, str]] = None,
+    admin_contact: Optional[Dict[str, str]] = None,
+    billing_contact: Optional[Dict[str, str]] = None,
+    id_protection: bool = False,
+    eligibility_fields: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build the SOAP parameters for a single domain registration"""
+    params = {
+        "domainName": domain_name,
+        "years": years,
+        "nameServers": nameservers,
+        "registrant_contact": registrant_contact
+    }
+
+    # Use registrant contact as default for other contacts if not provided
+    params["technical_contact"] = technical_contact or registrant_contact
+    params["admin_contact"] = admin_contact or registrant_contact
+    params["billing_contact"] = billing_contact or registrant_contact
+
+    if id_protection:
+        params["idProtection"] = "on"
+
+    if eligibility_fields:
+        params["eligibilityFields"] = eligibility_fields
+
+    return params
+
 @mcp.tool()
 def register_domain(
     domain_name: str,
@@ -213,26 +392,27 @@ def register_domain(
     Returns:
         Dictionary with registration result
     """
-    params = {
-        "domainName": domain_name,
-        "years": years,
-        "nameServers": nameservers,
-        "registrant_contact": registrant_contact
-    }
-
-    # Use registrant contact as default for other contacts if not provided
-    params["technical_contact"] = technical_contact or registrant_contact
-    params["admin_contact"] = admin_contact or registrant_contact
-    params["billing_contact"] = billing_contact or registrant_contact
-
-    if id_protection:
-        params["idProtection"] = "on"
-
-    if eligibility_fields:
-        params["eligibilityFields"] = eligibility_fields
-
+    params = _registration_params(
+        domain_name, years, nameservers, registrant_contact,
+        technical_contact, admin_contact, billing_contact,
+        id_protection, eligibility_fields
+    )
     return base.safe_soap_call("domainRegister", params, reseller_id, api_key)
 
+# Per-domain fields for bulk_register_domain, in register_domain's positional order
+_REGISTRATION_DEFAULTS = {
+    "years": 1,
+    "nameservers": [],
+    "registrant_contact": {},
+    "technical_contact": None,
+    "admin_contact": None,
+    "billing_contact": None,
+    "id_protection": False,
+    "eligibility_fields": None
+}
+_REG_KEYS = ("domain_name",) + tuple(_REGISTRATION_DEFAULTS)
+_registration_fields = itemgetter(*_REG_KEYS)
+
 @mcp.tool()
 def bulk_register_domain(
     domains: List[Dict[str, Any]],
@@ -240,7 +420,10 @@ def bulk_register_domain(
     api_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Register multiple domains at once.
+    Register multiple domains (up to 10).
+
+    Each domain is registered with its own domainRegister SOAP call; up to
+    SYNERGY_MAX_CONCURRENCY of them run at once.
 
     Args:
         domains: List of domain registration requests, each containing:
@@ -255,34 +438,43 @@ def bulk_register_domain(
     Returns:
         Dictionary with registration results for each domain
     """
+    if not domains:
+        return {"error": "At least one domain must be provided"}
     if len(domains) > 10:
         return {"error": "Maximum 10 domains can be registered at once"}
 
     results = {}
+    missing_idx = 0
+    registrations = {}
     for domain_info in domains:
         domain_name = domain_info.get("domain_name")
         if not domain_name:
-            results[f"domain_{len(results)}"] = {"error": "Missing domain_name"}
+            results[f"domain_{missing_idx}"] = {"error": "Missing domain_name"}
+            missing_idx += 1
+            continue
+        if not is_valid_domain(domain_name):
+            results[domain_name] = {"error": f"Invalid domain name: {domain_name}"}
+            continue
+        if domain_name in registrations:
+            # Only the first request for a domain is registered
             continue
 
-        # Extract parameters for single registration
-        reg_params = {
-            "domain_name": domain_name,
-            "years": domain_info.get("years", 1),
-            "nameservers": domain_info.get("nameservers", []),
-            "registrant_contact": domain_info.get("registrant_contact", {}),
-            "technical_contact": domain_info.get("technical_contact"),
-            "admin_contact": domain_info.get("admin_contact"),
-            "billing_contact": domain_info.get("billing_contact"),
-            "id_protection": domain_info.get("id_protection", False),
-            "eligibility_fields": domain_info.get("eligibility_fields"),
-            "reseller_id": reseller_id,
-            "api_key": api_key
-        }
+        # Extract parameters for single registration in one pass
+        registrations[domain_name] = _registration_fields({**_REGISTRATION_DEFAULTS, **domain_info})
 
-        # Register individual domain
-        result = register_domain(**reg_params)
-        results[domain_name] = result
+    if not registrations:
+        return results
+
+    # Each registration is its own network-bound SOAP call, so overlap them up to SYNERGY_MAX_CONCURRENCY at a time
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(registrations))) as executor:
+        futures = {
+            domain_name: executor.submit(
+                register_domain, *fields, reseller_id=reseller_id, api_key=api_key
+            )
+            for domain_name, fields in registrations.items()
+        }
+    for domain_name, future in futures.items():
+        results[domain_name] = future.result()
 
     return results
 
@@ -298,5 +490,11 @@ if __name__ == "__main__":
         base.logger.info("No environment credentials found - dynamic credentials mode enabled")
         base.logger.info("Tools will require reseller_id and api_key parameters")
 
+    # Build the SOAP client (WSDL fetch + parse) at boot instead of on the first tool call
+    try:
+        base.get_soap_client()
+    except ValueError as e:
+        base.logger.warning("SOAP client not initialized at startup, will retry on first call: %s", e)
+
     # Run the server
     mcp.run()
\ No newline at end of file
@@ -7,17 +7,20 @@ Provides tools for DNS records, email forwarding, and URL forwarding
 import sys
 import os
 from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 # Add shared module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
 from fastmcp import FastMCP
-from base_server import SynergyWholesaleBase
+from base_server import MAX_CONCURRENCY, SynergyWholesaleBase, async_client_lifespan, domain_params, is_valid_domain
 
 # Initialize FastMCP server
 mcp = FastMCP(
     name="Synergy Wholesale DNS",
     version="1.0.0",
+    lifespan=async_client_lifespan,
     instructions="""
     This server provides DNS and routing management tools for Synergy Wholesale.
 
@@ -37,12 +40,17 @@ mcp = FastMCP(
 # Initialize base server
 base = SynergyWholesaleBase("SynergyDNS")
 
+# Supported DNS record types, and those that must carry a priority
+_VALID_RECORD_TYPES = frozenset({"A", "AAAA", "CNAME", "MX", "TXT", "NS", "SRV", "CAA"})
+_PRIORITY_REQUIRED = frozenset({"MX", "SRV"})
+_FORWARD_TYPES = frozenset({"301", "302", "frame"})
+
 # ============================================================================
 # DNS ZONE MANAGEMENT
 # ============================================================================
 
 @mcp.tool()
-def add_dns_zone(
+async def add_dns_zone(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -58,10 +66,10 @@ def add_dns_zone(
     Returns:
         Dictionary with zone creation result
     """
-    return base.safe_soap_call("addDNSZone", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("addDNSZone", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def delete_dns_zone(
+async def delete_dns_zone(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -77,10 +85,10 @@ def delete_dns_zone(
     Returns:
         Dictionary with zone deletion result
     """
-    return base.safe_soap_call("deleteDNSZone", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("deleteDNSZone", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def list_dns_zone(
+async def list_dns_zone(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -96,14 +104,14 @@ def list_dns_zone(
     Returns:
         Dictionary with list of DNS records
     """
-    return base.safe_soap_call("listDNSZone", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("listDNSZone", domain_params(domain_name), reseller_id, api_key)
 
 # ============================================================================
 # DNS RECORD MANAGEMENT
 # ============================================================================
 
 @mcp.tool()
-def add_dns_record(
+async def add_dns_record(
     domain_name: str,
     record_type: str,
     name: str,
@@ -129,24 +137,28 @@ def add_dns_record(
     Returns:
         Dictionary with record creation result
     """
+    rtype = record_type.upper()
+    if rtype not in _VALID_RECORD_TYPES:
+        return {"error": f"Unsupported record type: {record_type}"}
+
     params = {
         "domainName": domain_name,
-        "type": record_type.upper(),
+        "type": rtype,
         "name": name,
         "content": content,
         "TTL": ttl
     }
 
     # Add priority for record types that require it
-    if record_type.upper() in ["MX", "SRV"] and priority is not None:
+    if rtype in _PRIORITY_REQUIRED:
+        if priority is None:
+            return {"error": f"Priority is required for {record_type} records"}
         params["priority"] = priority
-    elif record_type.upper() in ["MX", "SRV"]:
-        return {"error": f"Priority is required for {record_type} records"}
 
-    return base.safe_soap_call("addDNSRecord", params, reseller_id, api_key)
+    return await base.safe_soap_call_async("addDNSRecord", params, reseller_id, api_key)
 
 @mcp.tool()
-def delete_dns_record(
+async def delete_dns_record(
     domain_name: str,
     record_id: str,
     reseller_id: Optional[str] = None,
@@ -164,11 +176,42 @@ def delete_dns_record(
     Returns:
         Dictionary with deletion result
     """
-    return base.safe_soap_call("deleteDNSRecord", {
+    return await base.safe_soap_call_async("deleteDNSRecord", {
         "domainName": domain_name,
         "recordID": record_id
     }, reseller_id, api_key)
 
+def _record_update_params(
+    record_id: str,
+    record_type: Optional[str] = None,
+    name: Optional[str] = None,
+    content: Optional[str] = None,
+    ttl: Optional[int] = None,
+    priority: Optional[int] = None
+) -> Dict[str, Any]:
+    """Build the SOAP fields for one DNS record update, or an error dict if invalid."""
+    params = {"recordID": record_id}
+
+    # Add optional update parameters
+    if record_type:
+        rtype = record_type.upper()
+        if rtype not in _VALID_RECORD_TYPES:
+            return {"error": f"Unsupported record type: {record_type}"}
+        params["type"] = rtype
+    if name is not None:
+        params["name"] = name
+    if content is not None:
+        params["content"] = content
+    if ttl is not None:
+        params["TTL"] = ttl
+    if priority is not None:
+        params["priority"] = priority
+
+    if len(params) == 1:  # Only record ID provided
+        return {"error": "At least one field to update must be provided"}
+
+    return params
+
 @mcp.tool()
 def update_dns_record(
     domain_name: str,
@@ -198,27 +241,18 @@ def update_dns_record(
     Returns:
         Dictionary with update result
     """
-    params = {
-        "domainName": domain_name,
-        "recordID": record_id
-    }
+    record_params = _record_update_params(record_id, record_type, name, content, ttl, priority)
+    if "error" in record_params:
+        return record_params
 
-    # Add optional update parameters
-    if record_type:
-        params["type"] = record_type.upper()
-    if name is not None:
-        params["name"] = name
-    if content is not None:
-        params["content"] = content
-    if ttl is not None:
-        params["TTL"] = ttl
-    if priority is not None:
-        params["priority"] = priority
-
-    if len(params) == 2:  # Only domain and record ID provided
-        return {"error": "At least one field to update must be provided"}
+    return base.safe_soap_call("updateDNSRecord", {
+        "domainName": domain_name,
+        **record_params
+    }, reseller_id, api_key)
 
-    return base.safe_soap_call("updateDNSRecord", params, reseller_id, api_key)
+# Optional per-record fields for bulk_update_dns, in update_dns_record's positional order
+_RECORD_UPDATE_DEFAULTS = dict.fromkeys(("type", "name", "content", "ttl", "priority"))
+_record_update_fields = itemgetter(*_RECORD_UPDATE_DEFAULTS)
 
 @mcp.tool()
 def bulk_update_dns(
@@ -228,7 +262,10 @@ def bulk_update_dns(
     api_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Update multiple DNS records at once.
+    Update multiple DNS records (up to 50).
+
+    Each record is updated with its own updateDNSRecord SOAP call; up to
+    SYNERGY_MAX_CONCURRENCY of them run at once.
 
     Args:
         domain_name: The domain name
@@ -249,24 +286,30 @@ def bulk_update_dns(
         return {"error": "Maximum 50 records can be updated at once"}
 
     results = {}
+    missing_idx = 0
+    updates = {}
     for record_info in records:
         record_id = record_info.get("record_id")
         if not record_id:
-            results[f"record_{len(results)}"] = {"error": "Missing record_id"}
+            results[f"record_{missing_idx}"] = {"error": "Missing record_id"}
+            missing_idx += 1
             continue
-
-        result = update_dns_record(
-            domain_name=domain_name,
-            record_id=record_id,
-            record_type=record_info.get("type"),
-            name=record_info.get("name"),
-            content=record_info.get("content"),
-            ttl=record_info.get("ttl"),
-            priority=record_info.get("priority"),
-            reseller_id=reseller_id,
-            api_key=api_key
-        )
-        results[record_id] = result
+        updates[record_id] = _record_update_fields({**_RECORD_UPDATE_DEFAULTS, **record_info})
+
+    if not updates:
+        return results
+
+    # Each update is its own SOAP call, so overlap them up to SYNERGY_MAX_CONCURRENCY at a time
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(updates))) as executor:
+        futures = {
+            record_id: executor.submit(
+                update_dns_record, domain_name, record_id, *fields,
+                reseller_id=reseller_id, api_key=api_key
+            )
+            for record_id, fields in updates.items()
+        }
+    for record_id, future in futures.items():
+        results[record_id] = future.result()
 
     return results
 
@@ -274,8 +317,18 @@ def bulk_update_dns(
 # EMAIL FORWARDING
 # ============================================================================
 
+def _qualify_email(source_email: str, domain_name: str) -> str:
+    """Append the domain to a bare mailbox name ("info" -> "info@example.com")"""
+    local, sep, _ = source_email.partition("@")
+    return source_email if sep else f"{local}@{domain_name}"
+
+def _is_valid_email(address: str) -> bool:
+    """Check an email address has a mailbox and a syntactically valid domain"""
+    local, sep, domain = address.rpartition("@")
+    return bool(local and sep) and is_valid_domain(domain)
+
 @mcp.tool()
-def add_email_forward(
+async def add_email_forward(
     domain_name: str,
     source_email: str,
     destination_email: str,
@@ -295,18 +348,20 @@ def add_email_forward(
     Returns:
         Dictionary with forwarding setup result
     """
+    if not _is_valid_email(destination_email):
+        return {"error": f"Invalid destination email: {destination_email}"}
+
     # Ensure source email is properly formatted
-    if "@" not in source_email:
-        source_email = f"{source_email}@{domain_name}"
+    source_email = _qualify_email(source_email, domain_name)
 
-    return base.safe_soap_call("addMailForward", {
+    return await base.safe_soap_call_async("addMailForward", {
         "domainName": domain_name,
         "sourceEmail": source_email,
         "destinationEmail": destination_email
     }, reseller_id, api_key)
 
 @mcp.tool()
-def delete_email_forward(
+async def delete_email_forward(
     domain_name: str,
     source_email: str,
     reseller_id: Optional[str] = None,
@@ -325,16 +380,15 @@ def delete_email_forward(
         Dictionary with forwarding removal result
     """
     # Ensure source email is properly formatted
-    if "@" not in source_email:
-        source_email = f"{source_email}@{domain_name}"
+    source_email = _qualify_email(source_email, domain_name)
 
-    return base.safe_soap_call("deleteMailForward", {
+    return await base.safe_soap_call_async("deleteMailForward", {
         "domainName": domain_name,
         "sourceEmail": source_email
     }, reseller_id, api_key)
 
 @mcp.tool()
-def list_email_forwards(
+async def list_email_forwards(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -350,14 +404,14 @@ def list_email_forwards(
     Returns:
         Dictionary with list of email forwarding rules
     """
-    return base.safe_soap_call("listMailForwards", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("listMailForwards", domain_params(domain_name), reseller_id, api_key)
 
 # ============================================================================
 # URL FORWARDING
 # ============================================================================
 
 @mcp.tool()
-def add_url_forward(
+async def add_url_forward(
     domain_name: str,
     subdomain: str,
     destination_url: str,
@@ -381,8 +435,12 @@ def add_url_forward(
     Returns:
         Dictionary with URL forwarding setup result
     """
-    if forward_type not in ["301", "302", "frame"]:
+    if forward_type not in _FORWARD_TYPES:
         return {"error": "forward_type must be '301', '302', or 'frame'"}
+    if not subdomain:
+        return {"error": 'subdomain is required (use "@" for the root domain)'}
+    if not destination_url.startswith(("http://", "https://")):
+        return {"error": "destination_url must start with http:// or https://"}
 
     params = {
         "domainName": domain_name,
@@ -394,10 +452,10 @@ def add_url_forward(
     if forward_type == "frame" and forward_title:
         params["title"] = forward_title
 
-    return base.safe_soap_call("addSimpleURLForward", params, reseller_id, api_key)
+    return await base.safe_soap_call_async("addSimpleURLForward", params, reseller_id, api_key)
 
 @mcp.tool()
-def delete_url_forward(
+async def delete_url_forward(
     domain_name: str,
     subdomain: str,
     reseller_id: Optional[str] = None,
@@ -415,13 +473,13 @@ def delete_url_forward(
     Returns:
         Dictionary with forwarding removal result
     """
-    return base.safe_soap_call("deleteSimpleURLForward", {
+    return await base.safe_soap_call_async("deleteSimpleURLForward", {
         "domainName": domain_name,
         "subdomain": subdomain
     }, reseller_id, api_key)
 
 @mcp.tool()
-def list_url_forwards(
+async def list_url_forwards(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -437,7 +495,7 @@ def list_url_forwards(
     Returns:
         Dictionary with list of URL forwarding rules
     """
-    return base.safe_soap_call("listSimpleURLForwards", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("listSimpleURLForwards", domain_params(domain_name), reseller_id, api_key)
 
 # ============================================================================
 # MAIN ENTRY POINT
@@ -451,5 +509,11 @@ if __name__ == "__main__":
         base.logger.info("No environment credentials found - dynamic credentials mode enabled")
         base.logger.info("Tools will require reseller_id and api_key parameters")
 
+    # Build the SOAP client (WSDL fetch + parse) at boot instead of on the first tool call
+    try:
+        base.get_soap_client()
+    except ValueError as e:
+        base.logger.warning("SOAP client not initialized at startup, will retry on first call: %s", e)
+
     # Run the server
     mcp.run()
\ No newline at end of file
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Synergy Wholesale MCP Server
+Serves the tools of all six Synergy Wholesale servers from one process
+"""
+
+import sys
+import os
+import importlib.util
+
+# Add shared module to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from fastmcp import FastMCP
+from base_server import SynergyWholesaleBase, async_client_lifespan
+
+# Individual servers mounted into this one, by directory
+SERVER_DIRS = (
+    "synergy-wholesale-discovery-mcp",
+    "synergy-wholesale-portfolio-mcp",
+    "synergy-wholesale-transfers-mcp",
+    "synergy-wholesale-dns-mcp",
+    "synergy-wholesale-advanced-mcp",
+    "synergy-wholesale-account-mcp",
+)
+
+def load_server(directory: str) -> FastMCP:
+    """Import an individual server's module and return its FastMCP instance"""
+    path = os.path.join(os.path.dirname(__file__), '..', directory, 'server.py')
+    spec = importlib.util.spec_from_file_location(directory.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.mcp
+
+# Initialize FastMCP server
+mcp = FastMCP(
+    name="Synergy Wholesale",
+    version="1.0.0",
+    lifespan=async_client_lifespan,
+    instructions="""
+    This server provides every Synergy Wholesale tool: domain discovery and registration,
+    portfolio management, transfers, DNS and forwarding, advanced registry features,
+    and account utilities.
+
+    All tools share one SOAP client, connection pool, response cache and rate limit.
+
+    All tools support dynamic credential passing or environment variables:
+    - SYNERGY_RESELLER_ID: Your Synergy Wholesale reseller ID
+    - SYNERGY_API_KEY: Your Synergy Wholesale API key
+    """
+)
+
+# Mount each server without a namespace so tool names match the individual servers
+for server_dir in SERVER_DIRS:
+    mcp.mount(load_server(server_dir))
+
+# Initialize base server
+base = SynergyWholesaleBase("Synergy")
+
+# ============================================================================
+# MAIN ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    # Check if credentials are provided via environment
+    has_env_creds = bool(os.getenv("SYNERGY_RESELLER_ID") and os.getenv("SYNERGY_API_KEY"))
+
+    if not has_env_creds:
+        base.logger.info("No environment credentials found - dynamic credentials mode enabled")
+        base.logger.info("Tools will require reseller_id and api_key parameters")
+
+    # Build the SOAP client (WSDL fetch + parse) at boot instead of on the first tool call
+    try:
+        base.get_soap_client()
+    except ValueError as e:
+        base.logger.warning("SOAP client not initialized at startup, will retry on first call: %s", e)
+
+    # Run the server
+    mcp.run()
@@ -6,18 +6,20 @@ Provides tools for managing existing domains and their settings
 
 import sys
 import os
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Dict, Any, AsyncIterator, List, Optional
 
 # Add shared module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
 from fastmcp import FastMCP
-from base_server import SynergyWholesaleBase
+from base_server import SynergyWholesaleBase, async_client_lifespan, domain_params, gather_bounded
 
 # Initialize FastMCP server
 mcp = FastMCP(
     name="Synergy Wholesale Portfolio",
     version="1.0.0",
+    lifespan=async_client_lifespan,
     instructions="""
     This server provides domain portfolio management tools for Synergy Wholesale.
 
@@ -39,14 +41,21 @@ mcp = FastMCP(
 # Initialize base server
 base = SynergyWholesaleBase("SynergyPortfolio")
 
+# Request limits enforced before calling the API
+_MAX_BULK_INFO = 50
+_MAX_LIST_PAGE = 500
+_MAX_BULK_RENEW = 20
+_MIN_NAMESERVERS = 2
+_MAX_NAMESERVERS = 6
+
 # ============================================================================
 # DOMAIN LISTING & INFORMATION
 # ============================================================================
 
 @mcp.tool()
-def list_domains(
+async def list_domains(
     limit: int = 100,
-    offset: int = 0,
+    page: int = 1,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -54,21 +63,87 @@ def list_domains(
     List all domains in your account.
 
     Args:
-        limit: Maximum number of results (default 100)
-        offset: Starting position for pagination (default 0)
+        limit: Maximum number of results per page (default 100, max 500)
+        page: Page of results to return, starting at 1 (default 1)
         reseller_id: Optional Synergy Wholesale reseller ID
         api_key: Optional Synergy Wholesale API key
 
     Returns:
         Dictionary with list of domains
     """
-    return base.safe_soap_call("listDomains", {
-        "limit": limit,
-        "offset": offset
+    if not 1 <= limit <= _MAX_LIST_PAGE:
+        return {"error": f"limit must be between 1 and {_MAX_LIST_PAGE}"}
+    if page < 1:
+        return {"error": "page must be at least 1"}
+
+    return await base.safe_soap_call_async("listDomains", {
+        "page": page,
+        "limit": limit
     }, reseller_id, api_key)
 
+async def iter_domains(
+    page_size: int = 200,
+    reseller_id: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield every domain in the account, fetching the next page while the
+    current one is being consumed. page_size is capped at the API's 500 per page.
+
+    Raises:
+        RuntimeError: If a page request fails
+    """
+    page_size = min(page_size, _MAX_LIST_PAGE)
+    page_number = 1
+    pending = asyncio.create_task(list_domains(page_size, page_number, reseller_id, api_key))
+    try:
+        while pending is not None:
+            page = await pending
+            if "error" in page:
+                raise RuntimeError(page["error"])
+
+            domains = page.get("domainList") or []
+            page_number += 1
+            # A short page is the last one; otherwise start on the next before yielding
+            pending = (
+                asyncio.create_task(list_domains(page_size, page_number, reseller_id, api_key))
+                if len(domains) >= page_size else None
+            )
+            for domain in domains:
+                yield domain
+    finally:
+        if pending is not None:
+            pending.cancel()
+
 @mcp.tool()
-def domain_info(
+async def list_all_domains(
+    page_size: int = 200,
+    reseller_id: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    List every domain in your account, paging through the API automatically.
+
+    Args:
+        page_size: Domains requested per API call (default 200, max 500)
+        reseller_id: Optional Synergy Wholesale reseller ID
+        api_key: Optional Synergy Wholesale API key
+
+    Returns:
+        Dictionary with the full domain list and total count
+    """
+    if page_size < 1:
+        return {"error": "page_size must be at least 1"}
+
+    try:
+        domains = [domain async for domain in iter_domains(page_size, reseller_id, api_key)]
+    except RuntimeError as e:
+        return {"error": str(e)}
+
+    return {"status": "OK", "domainList": domains, "total": len(domains)}
+
+@mcp.tool()
+async def domain_info(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -84,10 +159,10 @@ def domain_info(
     Returns:
         Dictionary with domain details including status, expiry, nameservers, etc.
     """
-    return base.safe_soap_call("domainInfo", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("domainInfo", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def bulk_domain_info(
+async def bulk_domain_info(
     domain_names: List[str],
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -103,10 +178,10 @@ def bulk_domain_info(
     Returns:
         Dictionary with information for each domain
     """
-    if len(domain_names) > 50:
-        return {"error": "Maximum 50 domains can be queried at once"}
+    if len(domain_names) > _MAX_BULK_INFO:
+        return {"error": f"Maximum {_MAX_BULK_INFO} domains can be queried at once"}
 
-    return base.safe_soap_call("bulkDomainInfo", {
+    return await base.safe_soap_call_async("bulkDomainInfo", {
         "domainNameList": domain_names
     }, reseller_id, api_key)
 
@@ -115,7 +190,7 @@ def bulk_domain_info(
 # ============================================================================
 
 @mcp.tool()
-def update_nameservers(
+async def update_nameservers(
     domain_name: str,
     nameservers: List[str],
     reseller_id: Optional[str] = None,
@@ -133,16 +208,16 @@ def update_nameservers(
     Returns:
         Dictionary with update result
     """
-    if len(nameservers) < 2 or len(nameservers) > 6:
-        return {"error": "Must provide between 2 and 6 nameservers"}
+    if not _MIN_NAMESERVERS <= len(nameservers) <= _MAX_NAMESERVERS:
+        return {"error": f"Must provide between {_MIN_NAMESERVERS} and {_MAX_NAMESERVERS} nameservers"}
 
-    return base.safe_soap_call("updateName", {
+    return await base.safe_soap_call_async("updateName", {
         "domainName": domain_name,
         "nameServers": nameservers
     }, reseller_id, api_key)
 
 @mcp.tool()
-def update_domain_password(
+async def update_domain_password(
     domain_name: str,
     new_password: str,
     reseller_id: Optional[str] = None,
@@ -160,13 +235,13 @@ def update_domain_password(
     Returns:
         Dictionary with update result
     """
-    return base.safe_soap_call("updateDomainPassword", {
+    return await base.safe_soap_call_async("updateDomainPassword", {
         "domainName": domain_name,
         "newPassword": new_password
     }, reseller_id, api_key)
 
 @mcp.tool()
-def lock_domain(
+async def lock_domain(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -182,10 +257,10 @@ def lock_domain(
     Returns:
         Dictionary with lock status
     """
-    return base.safe_soap_call("lockDomain", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("lockDomain", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def unlock_domain(
+async def unlock_domain(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -201,10 +276,10 @@ def unlock_domain(
     Returns:
         Dictionary with unlock status
     """
-    return base.safe_soap_call("unlockDomain", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("unlockDomain", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def enable_auto_renewal(
+async def enable_auto_renewal(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -220,10 +295,10 @@ def enable_auto_renewal(
     Returns:
         Dictionary with auto-renewal status
     """
-    return base.safe_soap_call("enableAutoRenewal", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("enableAutoRenewal", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def disable_auto_renewal(
+async def disable_auto_renewal(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -239,10 +314,10 @@ def disable_auto_renewal(
     Returns:
         Dictionary with auto-renewal status
     """
-    return base.safe_soap_call("disableAutoRenewal", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("disableAutoRenewal", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def enable_id_protection(
+async def enable_id_protection(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -258,10 +333,10 @@ def enable_id_protection(
     Returns:
         Dictionary with privacy protection status
     """
-    return base.safe_soap_call("enableIDPrivacyProtection", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("enableIDPrivacyProtection", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def disable_id_protection(
+async def disable_id_protection(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -277,14 +352,14 @@ def disable_id_protection(
     Returns:
         Dictionary with privacy protection status
     """
-    return base.safe_soap_call("disableIDPrivacyProtection", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("disableIDPrivacyProtection", domain_params(domain_name), reseller_id, api_key)
 
 # ============================================================================
 # DOMAIN RENEWAL
 # ============================================================================
 
 @mcp.tool()
-def renew_domain(
+async def renew_domain(
     domain_name: str,
     years: int = 1,
     reseller_id: Optional[str] = None,
@@ -302,19 +377,19 @@ def renew_domain(
     Returns:
         Dictionary with renewal result
     """
-    return base.safe_soap_call("renewDomain", {
+    return await base.safe_soap_call_async("renewDomain", {
         "domainName": domain_name,
         "years": years
     }, reseller_id, api_key)
 
 @mcp.tool()
-def bulk_renew_domain(
+async def bulk_renew_domain(
     domains: List[Dict[str, Any]],
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Renew multiple domains at once.
+    Renew multiple domains concurrently.
 
     Args:
         domains: List of domain renewal requests, each containing:
@@ -326,20 +401,43 @@ def bulk_renew_domain(
     Returns:
         Dictionary with renewal results for each domain
     """
-    if len(domains) > 20:
-        return {"error": "Maximum 20 domains can be renewed at once"}
+    if len(domains) > _MAX_BULK_RENEW:
+        return {"error": f"Maximum {_MAX_BULK_RENEW} domains can be renewed at once"}
 
     results = {}
+    missing_idx = 0
+    renewals = {}
     for domain_info in domains:
         domain_name = domain_info.get("domain_name")
         years = domain_info.get("years", 1)
 
         if not domain_name:
-            results[f"domain_{len(results)}"] = {"error": "Missing domain_name"}
+            results[f"domain_{missing_idx}"] = {"error": "Missing domain_name"}
+            missing_idx += 1
             continue
 
-        result = renew_domain(domain_name, years, reseller_id, api_key)
-        results[domain_name] = result
+        renewals[domain_name] = years
+
+    if not renewals:
+        return results
+
+    # One bulkDomainInfo call weeds out domains that are not in this account
+    preflight = await base.bulk_preflight(renewals, reseller_id, api_key)
+    if preflight:
+        for domain_name in list(renewals):
+            info = preflight.get(domain_name.lower())
+            if info is None or info.get("status") != "OK":
+                results[domain_name] = {
+                    "error": (info or {}).get("errorMessage") or "Domain not found in this account"
+                }
+                del renewals[domain_name]
+
+    # Renew concurrently, bounded by SYNERGY_MAX_CONCURRENCY
+    renewed = await gather_bounded(
+        renew_domain(domain_name, years, reseller_id, api_key)
+        for domain_name, years in renewals.items()
+    )
+    results.update(zip(renewals, renewed))
 
     return results
 
@@ -348,7 +446,7 @@ def bulk_renew_domain(
 # ============================================================================
 
 @mcp.tool()
-def update_contacts(
+async def update_contacts(
     domain_name: str,
     registrant_contact: Optional[Dict[str, str]] = None,
     technical_contact: Optional[Dict[str, str]] = None,
@@ -372,24 +470,25 @@ def update_contacts(
     Returns:
         Dictionary with update result
     """
-    params = {"domainName": domain_name}
-
-    if registrant_contact:
-        params["registrant_contact"] = registrant_contact
-    if technical_contact:
-        params["technical_contact"] = technical_contact
-    if admin_contact:
-        params["admin_contact"] = admin_contact
-    if billing_contact:
-        params["billing_contact"] = billing_contact
-
-    if len(params) == 1:  # Only domain name provided
+    contacts = {
+        field: contact
+        for field, contact in (
+            ("registrant_contact", registrant_contact),
+            ("technical_contact", technical_contact),
+            ("admin_contact", admin_contact),
+            ("billing_contact", billing_contact),
+        )
+        if contact
+    }
+    if not contacts:
         return {"error": "At least one contact must be provided for update"}
 
-    return base.safe_soap_call("updateContact", params, reseller_id, api_key)
+    params = domain_params(domain_name)
+    params.update(contacts)
+    return await base.safe_soap_call_async("updateContact", params, reseller_id, api_key)
 
 @mcp.tool()
-def list_contacts(
+async def list_contacts(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -405,10 +504,10 @@ def list_contacts(
     Returns:
         Dictionary with contact information
     """
-    return base.safe_soap_call("listContacts", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("listContacts", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def get_raw_contacts(
+async def get_raw_contacts(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -424,10 +523,10 @@ def get_raw_contacts(
     Returns:
         Dictionary with detailed contact information
     """
-    return base.safe_soap_call("rawDomainContacts", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("rawDomainContacts", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def list_id_protected_contacts(
+async def list_id_protected_contacts(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -443,10 +542,10 @@ def list_id_protected_contacts(
     Returns:
         Dictionary with protected contact information
     """
-    return base.safe_soap_call("listIDProtectedContacts", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("listIDProtectedContacts", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def resend_registrant_email(
+async def resend_registrant_email(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -462,10 +561,10 @@ def resend_registrant_email(
     Returns:
         Dictionary with email send result
     """
-    return base.safe_soap_call("resendChangeOfRegistrantEmails", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("resendChangeOfRegistrantEmails", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def cancel_pending_registrant_update(
+async def cancel_pending_registrant_update(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -481,7 +580,7 @@ def cancel_pending_registrant_update(
     Returns:
         Dictionary with cancellation result
     """
-    return base.safe_soap_call("cancelPendingRegistrantUpdate", {"domainName": domain_name}, reseller_id, api_key)
+    return await base.safe_soap_call_async("cancelPendingRegistrantUpdate", domain_params(domain_name), reseller_id, api_key)
 
 # ============================================================================
 # MAIN ENTRY POINT
@@ -495,5 +594,11 @@ if __name__ == "__main__":
         base.logger.info("No environment credentials found - dynamic credentials mode enabled")
         base.logger.info("Tools will require reseller_id and api_key parameters")
 
+    # Build the SOAP client (WSDL fetch + parse) at boot instead of on the first tool call
+    try:
+        base.get_soap_client()
+    except ValueError as e:
+        base.logger.warning("SOAP client not initialized at startup, will retry on first call: %s", e)
+
     # Run the server
     mcp.run()
\ No newline at end of file
@@ -12,12 +12,13 @@ from typing import Dict, Any, List, Optional
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
 from fastmcp import FastMCP
-from base_server import SynergyWholesaleBase
+from base_server import SynergyWholesaleBase, async_client_lifespan, domain_params, gather_bounded, is_valid_domain
 
 # Initialize FastMCP server
 mcp = FastMCP(
     name="Synergy Wholesale Transfers",
     version="1.0.0",
+    lifespan=async_client_lifespan,
     instructions="""
     This server provides domain transfer management tools for Synergy Wholesale.
 
@@ -38,12 +39,16 @@ mcp = FastMCP(
 # Initialize base server
 base = SynergyWholesaleBase("SynergyTransfers")
 
+# Request limits enforced before calling the API
+_MAX_BULK_TRANSFER = 10
+_MAX_BULK_STATUS = 50
+
 # ============================================================================
 # TRANSFER ELIGIBILITY & INITIATION
 # ============================================================================
 
 @mcp.tool()
-def is_domain_transferrable(
+async def is_domain_transferrable(
     domain_name: str,
     auth_code: Optional[str] = None,
     reseller_id: Optional[str] = None,
@@ -61,13 +66,13 @@ def is_domain_transferrable(
     Returns:
         Dictionary with transfer eligibility status
     """
-    params = {"domainName": domain_name}
+    params = domain_params(domain_name)
     if auth_code:
         params["authCode"] = auth_code
-    return base.safe_soap_call("isDomainTransferrable", params, reseller_id, api_key)
+    return await base.safe_soap_call_async("isDomainTransferrable", params, reseller_id, api_key)
 
 @mcp.tool()
-def transfer_domain(
+async def transfer_domain(
     domain_name: str,
     auth_code: str,
     years: Optional[int] = None,
@@ -99,16 +104,16 @@ def transfer_domain(
     if id_protection:
         params["idProtection"] = "on"
 
-    return base.safe_soap_call("transferDomain", params, reseller_id, api_key)
+    return await base.safe_soap_call_async("transferDomain", params, reseller_id, api_key)
 
 @mcp.tool()
-def bulk_transfer_domain(
+async def bulk_transfer_domain(
     domains: List[Dict[str, Any]],
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Transfer multiple domains at once.
+    Transfer multiple domains concurrently.
 
     Args:
         domains: List of transfer requests, each containing:
@@ -122,30 +127,47 @@ def bulk_transfer_domain(
     Returns:
         Dictionary with transfer results for each domain
     """
-    if len(domains) > 10:
-        return {"error": "Maximum 10 domains can be transferred at once"}
+    if len(domains) > _MAX_BULK_TRANSFER:
+        return {"error": f"Maximum {_MAX_BULK_TRANSFER} domains can be transferred at once"}
 
     results = {}
+    missing_idx = 0
+    transfers = {}
     for transfer_info in domains:
         domain_name = transfer_info.get("domain_name")
         auth_code = transfer_info.get("auth_code")
 
         if not domain_name:
-            results[f"domain_{len(results)}"] = {"error": "Missing domain_name"}
+            results[f"domain_{missing_idx}"] = {"error": "Missing domain_name"}
+            missing_idx += 1
             continue
         if not auth_code:
             results[domain_name] = {"error": "Missing auth_code"}
             continue
 
-        result = transfer_domain(
+        transfers[domain_name] = transfer_info
+
+    # One bulkDomainInfo call weeds out domains that are already in this account
+    preflight = await base.bulk_preflight(transfers, reseller_id, api_key)
+    for domain_name in list(transfers):
+        info = preflight.get(domain_name.lower())
+        if info is not None and info.get("status") == "OK":
+            results[domain_name] = {"error": "Domain is already in this account"}
+            del transfers[domain_name]
+
+    # Initiate transfers concurrently, bounded by SYNERGY_MAX_CONCURRENCY
+    initiated = await gather_bounded(
+        transfer_domain(
             domain_name=domain_name,
-            auth_code=auth_code,
+            auth_code=transfer_info["auth_code"],
             years=transfer_info.get("years"),
             id_protection=transfer_info.get("id_protection", False),
             reseller_id=reseller_id,
             api_key=api_key
         )
-        results[domain_name] = result
+        for domain_name, transfer_info in transfers.items()
+    )
+    results.update(zip(transfers, initiated))
 
     return results
 
@@ -154,7 +176,7 @@ def bulk_transfer_domain(
 # ============================================================================
 
 @mcp.tool()
-def resend_transfer_email(
+async def resend_transfer_email(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -170,12 +192,10 @@ def resend_transfer_email(
     Returns:
         Dictionary with email send result
     """
-    return base.safe_soap_call("resendTransferEmail", {
-        "domainName": domain_name
-    }, reseller_id, api_key)
+    return await base.safe_soap_call_async("resendTransferEmail", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def cancel_inbound_transfer(
+async def cancel_inbound_transfer(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -191,12 +211,10 @@ def cancel_inbound_transfer(
     Returns:
         Dictionary with cancellation result
     """
-    return base.safe_soap_call("cancelInboundTransfer", {
-        "domainName": domain_name
-    }, reseller_id, api_key)
+    return await base.safe_soap_call_async("cancelInboundTransfer", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def approve_outbound_transfer(
+async def approve_outbound_transfer(
     domain_name: str,
     ack_key: str,
     reseller_id: Optional[str] = None,
@@ -214,13 +232,13 @@ def approve_outbound_transfer(
     Returns:
         Dictionary with approval result
     """
-    return base.safe_soap_call("approveOutboundTransfer", {
+    return await base.safe_soap_call_async("approveOutboundTransfer", {
         "domainName": domain_name,
         "ackKey": ack_key
     }, reseller_id, api_key)
 
 @mcp.tool()
-def reject_outbound_transfer(
+async def reject_outbound_transfer(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -236,16 +254,14 @@ def reject_outbound_transfer(
     Returns:
         Dictionary with rejection result
     """
-    return base.safe_soap_call("rejectOutboundTransfer", {
-        "domainName": domain_name
-    }, reseller_id, api_key)
+    return await base.safe_soap_call_async("rejectOutboundTransfer", domain_params(domain_name), reseller_id, api_key)
 
 # ============================================================================
 # TRANSFER LOCKS
 # ============================================================================
 
 @mcp.tool()
-def transfer_lock(
+async def transfer_lock(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -261,12 +277,10 @@ def transfer_lock(
     Returns:
         Dictionary with lock status
     """
-    return base.safe_soap_call("transferLock", {
-        "domainName": domain_name
-    }, reseller_id, api_key)
+    return await base.safe_soap_call_async("transferLock", domain_params(domain_name), reseller_id, api_key)
 
 @mcp.tool()
-def transfer_unlock(
+async def transfer_unlock(
     domain_name: str,
     reseller_id: Optional[str] = None,
     api_key: Optional[str] = None
@@ -282,51 +296,116 @@ def transfer_unlock(
     Returns:
         Dictionary with unlock status
     """
-    return base.safe_soap_call("transferUnlock", {
-        "domainName": domain_name
-    }, reseller_id, api_key)
+    return await base.safe_soap_call_async("transferUnlock", domain_params(domain_name), reseller_id, api_key)
 
 # ============================================================================
 # TRANSFER STATUS
 # ============================================================================
 
+def _transfer_status(domain_name: str, info: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the transfer-related fields out of a domain's info"""
+    return {
+        "domain": domain_name,
+        "status": info.get("status"),
+        "transfer_status": info.get("transferStatus"),
+        "transfer_date": info.get("transferDate"),
+        "current_registrar": info.get("registrar"),
+        "locked": info.get("locked")
+    }
+
 @mcp.tool()
-def get_transfer_status(
+async def get_transfer_status(
     domain_name: str,
     reseller_id: Optional[str] = None,
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    force_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Check the status of a pending transfer.
 
+    Repeated polls are served from the shared domainInfo cache (SYNERGY_CACHE_TTL),
+    which any change made through these servers clears for the domain.
+
     Args:
         domain_name: Domain with pending transfer
         reseller_id: Optional Synergy Wholesale reseller ID
         api_key: Optional Synergy Wholesale API key
+        force_refresh: Bypass the cache and query the API
 
     Returns:
         Dictionary with transfer status details
     """
+    # Domain names are case-insensitive; normalize so every spelling shares one cache entry
+    domain_name = domain_name.strip().lower()
+    if force_refresh:
+        base.invalidate_domain(domain_name)
+
     # This might need to be mapped to a different API call depending on Synergy's implementation
     # Using domainInfo as it often contains transfer status
-    result = base.safe_soap_call("domainInfo", {
-        "domainName": domain_name
-    }, reseller_id, api_key)
+    result = await base.safe_soap_call_async("domainInfo", domain_params(domain_name), reseller_id, api_key)
 
     # Extract transfer-related information if available
     if "error" not in result:
-        transfer_info = {
-            "domain": domain_name,
-            "status": result.get("status"),
-            "transfer_status": result.get("transferStatus"),
-            "transfer_date": result.get("transferDate"),
-            "current_registrar": result.get("registrar"),
-            "locked": result.get("locked")
-        }
-        return transfer_info
+        return _transfer_status(domain_name, result)
 
     return result
 
+@mcp.tool()
+async def get_transfer_status_batch(
+    domain_names: List[str],
+    reseller_id: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Check the status of several pending transfers with a single API call.
+
+    Args:
+        domain_names: Domains with pending transfers (max 50)
+        reseller_id: Optional Synergy Wholesale reseller ID
+        api_key: Optional Synergy Wholesale API key
+
+    Returns:
+        Dictionary with transfer status details for each domain
+    """
+    if not domain_names:
+        return {"error": "At least one domain name must be provided"}
+
+    unique_names = list(dict.fromkeys(domain_names))
+    if len(unique_names) > _MAX_BULK_STATUS:
+        return {"error": f"Maximum {_MAX_BULK_STATUS} domains can be queried at once"}
+
+    # Malformed names are reported locally; the rest are queried once each, whatever their spelling
+    results = {}
+    queries = {}
+    for domain_name in unique_names:
+        if is_valid_domain(domain_name):
+            queries[domain_name] = domain_name.lower()
+        else:
+            results[domain_name] = {"error": f"Invalid domain name: {domain_name}"}
+    if not queries:
+        return results
+
+    lookup = list(dict.fromkeys(queries.values()))
+    result = await base.safe_soap_call_async("bulkDomainInfo", {"domainList": lookup}, reseller_id, api_key)
+    if "error" in result:
+        return result
+
+    infos = {
+        str(info.get("domainName", "")).lower(): info
+        for info in result.get("domainList") or []
+        if isinstance(info, dict)
+    }
+
+    for domain_name, query in queries.items():
+        info = infos.get(query)
+        if info is None:
+            results[domain_name] = {"error": "Domain not found in response"}
+        elif str(info.get("status", "")).startswith("ERR_"):
+            results[domain_name] = {"error": info.get("errorMessage", "Unknown error occurred")}
+        else:
+            results[domain_name] = _transfer_status(domain_name, info)
+    return results
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
@@ -339,5 +418,11 @@ if __name__ == "__main__":
         base.logger.info("No environment credentials found - dynamic credentials mode enabled")
         base.logger.info("Tools will require reseller_id and api_key parameters")
 
+    # Build the SOAP client (WSDL fetch + parse) at boot instead of on the first tool call
+    try:
+        base.get_soap_client()
+    except ValueError as e:
+        base.logger.warning("SOAP client not initialized at startup, will retry on first call: %s", e)
+
     # Run the server
     mcp.run()
\ No newline at end of file